@@ -150,10 +150,8 @@ class Projectile:
 # Simulator / Renderer
 # -------------------------
 class Simulator:
-    def __init__(self, root):
+    def __init__(self, root=None):
         self.root = root
-        self.canvas = tk.Canvas(root, width=WIDTH, height=HEIGHT, bg="black")
-        self.canvas.pack()
         self.projectiles = []
         self.particles = []
         self.target = {"x": WIDTH - 160, "y": GROUND_Y - 120, "r": 36}
@@ -164,6 +162,14 @@ class Simulator:
         self.last_auto_fire = 0.0
         self.last_time = time.time()
         self.show_debug = False
+        self.running = True
+        if root is None:
+            # headless: no window, the caller drives step_sim (used by compare_engines.py)
+            self.canvas = None
+            return
+
+        self.canvas = tk.Canvas(root, width=WIDTH, height=HEIGHT, bg="black")
+        self.canvas.pack()
 
         # controls
         self.canvas.bind("<Motion>", self.on_mouse_move)
@@ -182,7 +188,6 @@ class Simulator:
         )
 
         # start loop
-        self.running = True
         self.loop()
 
     def hint_string(self):
@@ -21,6 +21,7 @@ class App:
         sim.MAX_PARTICLES=8000
         sim.AUTO_FIRE_RATE=100.0  
         sim.GROUND_Y=sim.HEIGHT-40
+        sim.WORLD_WIDTH=3000  # world wider than the window: pan/zoom or F to follow a shot
 
 
         root.mainloop()
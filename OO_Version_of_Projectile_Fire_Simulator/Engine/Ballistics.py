@@ -0,0 +1,105 @@
+"""
+Collision rules of the simulator, shared by Simulator.step_sim and the headless
+single-shot solver used by the shot service.
+"""
+
+import math
+
+from .Projectile_class import Projectile
+
+
+BOUNCE_SPEED = 180.0  # hitting the ground faster than this bounces, slower settles and explodes
+BOUNCE_KEEP_VY = 0.35
+BOUNCE_KEEP_VX = 0.6
+
+BOUNCE = 1
+SETTLE = 2
+
+
+def ground_contact(p, ground_y):
+    """Clamp p to the ground and apply the bounce; returns None, BOUNCE or SETTLE."""
+    if p.y < ground_y:
+        return None
+    p.y = ground_y
+    if abs(p.vy) > BOUNCE_SPEED:
+        p.vy = -p.vy * BOUNCE_KEEP_VY
+        p.vx *= BOUNCE_KEEP_VX
+        return BOUNCE
+    return SETTLE
+
+
+def in_target(p, target):
+    dx = p.x - target["x"]
+    dy = p.y - target["y"]
+    return dx * dx + dy * dy <= target["r"] ** 2
+
+
+def lifetime_bounds(width, height):
+    # where a projectile is still simulated: the world plus a margin for high arcs
+    return (-200, -500, width + 200, height + 500)
+
+
+def outside(p, bounds):
+    x0, y0, x1, y1 = bounds
+    return p.x < x0 or p.x > x1 or p.y < y0 or p.y > y1
+
+
+def simulate_shot(
+    angle,
+    speed,
+    gravity,
+    drag,
+    wind,
+    target,
+    origin=(80, 660),
+    ground_y=660,
+    bounds=None,
+    dt=1.0 / 60.0,
+    max_time=30.0,
+):
+    """
+    Fly one shot from `origin` with Projectile.step and the step_sim collision rules.
+    target is (x, y, r), bounds the (x0, y0, x1, y1) region where the shot stays
+    alive (default: a 1000x700 world plus margins). Returns where and when it ended:
+    outcome "target", "ground" (settled), "out" (left the world) or "timeout".
+    """
+    if bounds is None:
+        bounds = lifetime_bounds(1000, 700)
+    ox, oy = origin
+    p = Projectile(ox, oy, math.cos(angle) * speed, math.sin(angle) * speed, AIR_DRAG=drag, GRAVITY=gravity, WIND=wind)
+    tgt = {"x": target[0], "y": target[1], "r": target[2]}
+    bounces = 0
+    first_ground = None
+    outcome = "timeout"
+    steps = int(max_time / dt)
+    for _ in range(steps):
+        p.step(dt)
+        contact = ground_contact(p, ground_y)
+        if contact is not None:
+            if first_ground is None:
+                first_ground = (p.x, p.age)
+            if contact == SETTLE:
+                outcome = "ground"
+                break
+            bounces += 1
+            continue
+        if in_target(p, tgt):
+            outcome = "target"
+            break
+        if outside(p, bounds):
+            outcome = "out"
+            break
+    return {
+        "outcome": outcome,
+        "x": p.x,
+        "y": p.y,
+        "t": p.age,
+        "bounces": bounces,
+        "first_ground_x": None if first_ground is None else first_ground[0],
+        "first_ground_t": None if first_ground is None else first_ground[1],
+    }
+
+
+def simulate_many(shots):
+    # executor entry point: a list of simulate_shot kwargs -> list of results
+    return [simulate_shot(**kw) for kw in shots]
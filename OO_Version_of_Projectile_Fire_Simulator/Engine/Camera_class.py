@@ -0,0 +1,69 @@
+class Camera:
+    """
+    World <-> screen transform for a view of view_w x view_h pixels:
+    screen = (world - (x, y)) * zoom, where (x, y) is the world point at the
+    top-left corner of the window.
+
+    mode "free" keeps the camera where it was panned/zoomed to, "follow" eases
+    the view centre towards a target every update.
+    """
+
+    MIN_ZOOM = 0.2
+    MAX_ZOOM = 4.0
+
+    def __init__(self, view_w, view_h):
+        self.view_w = view_w
+        self.view_h = view_h
+        self.x = 0.0
+        self.y = 0.0
+        self.zoom = 1.0
+        self.mode = "free"
+        self.follow_rate = 4.0  # 1/s, how fast "follow" catches up
+
+    def to_screen(self, x, y):
+        z = self.zoom
+        return (x - self.x) * z, (y - self.y) * z
+
+    def to_world(self, sx, sy):
+        z = self.zoom
+        return sx / z + self.x, sy / z + self.y
+
+    def visible(self, margin=0.0):
+        """World rectangle (x0, y0, x1, y1) on screen, grown by margin world units."""
+        return (
+            self.x - margin,
+            self.y - margin,
+            self.x + self.view_w / self.zoom + margin,
+            self.y + self.view_h / self.zoom + margin,
+        )
+
+    def pan(self, dsx, dsy):
+        # drag by screen pixels
+        self.x -= dsx / self.zoom
+        self.y -= dsy / self.zoom
+
+    def zoom_at(self, factor, sx, sy):
+        # zoom keeping the world point under (sx, sy) fixed
+        wx, wy = self.to_world(sx, sy)
+        self.zoom = max(self.MIN_ZOOM, min(self.MAX_ZOOM, self.zoom * factor))
+        self.x = wx - sx / self.zoom
+        self.y = wy - sy / self.zoom
+
+    def center_on(self, wx, wy):
+        self.x = wx - self.view_w / (2.0 * self.zoom)
+        self.y = wy - self.view_h / (2.0 * self.zoom)
+
+    def clamp(self, x0, y0, x1, y1):
+        # keep the view inside the world rect, centred on it when the world is smaller than the view
+        w = self.view_w / self.zoom
+        h = self.view_h / self.zoom
+        self.x = (x0 + x1 - w) / 2.0 if w >= x1 - x0 else max(x0, min(x1 - w, self.x))
+        self.y = (y0 + y1 - h) / 2.0 if h >= y1 - y0 else max(y0, min(y1 - h, self.y))
+
+    def update(self, dt, target=None):
+        if self.mode != "follow" or target is None:
+            return
+        cx = self.x + self.view_w / (2.0 * self.zoom)
+        cy = self.y + self.view_h / (2.0 * self.zoom)
+        k = min(1.0, self.follow_rate * dt)
+        self.center_on(cx + (target[0] - cx) * k, cy + (target[1] - cy) * k)
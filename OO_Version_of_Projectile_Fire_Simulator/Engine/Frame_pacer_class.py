@@ -0,0 +1,90 @@
+import time
+
+
+class FramePacer:
+    """
+    Paces the Tk after() loop against absolute deadlines (start + n * period)
+    instead of "now + period". The time a frame spent stepping and drawing comes
+    off the wait before the next one, and rounding the delay to whole ms does
+    not add up from frame to frame, so the achieved rate matches the target.
+
+    A frame that starts more than one period behind its deadline skips its
+    render (the simulation still steps) so the loop can catch up; at most
+    max_skips renders in a row are skipped. When it falls further behind than
+    resync periods the schedule restarts from now instead of chasing a backlog.
+    """
+
+    __slots__ = (
+        "max_skips",
+        "resync",
+        "clock",
+        "deadline",
+        "last",
+        "frames",
+        "late",
+        "skipped",
+        "jitter",
+        "frame_time",
+        "_skips_in_row",
+    )
+
+    def __init__(self, max_skips=3, resync=4, clock=time.perf_counter):
+        self.max_skips = max_skips
+        self.resync = resync
+        self.clock = clock
+        self.deadline = None  # when the next frame should start
+        self.last = None  # start of the previous frame
+        self.frames = 0
+        self.late = 0  # frames that started more than a period after their deadline
+        self.skipped = 0  # renders dropped to catch up
+        self.jitter = 0.0  # smoothed |start - deadline|, seconds
+        self.frame_time = 0.0  # smoothed time between frame starts, seconds
+        self._skips_in_row = 0
+
+    def start_frame(self, fps, max_throughput=False):
+        """
+        Call at the top of a frame. Returns (dt, render): the measured time since
+        the previous frame and whether this frame should be drawn.
+        """
+        now = self.clock()
+        dt = 0.0 if self.last is None else now - self.last
+        self.last = now
+        self.frames += 1
+        if dt > 0:
+            self.frame_time += (dt - self.frame_time) * 0.1
+        if max_throughput or fps <= 0:
+            # benchmark mode: no waiting, draw everything
+            self.deadline = now
+            self._skips_in_row = 0
+            return dt, True
+
+        period = 1.0 / fps
+        if self.deadline is None:
+            self.deadline = now
+        lag = now - self.deadline
+        self.jitter += (abs(lag) - self.jitter) * 0.1
+        render = True
+        if lag > period:
+            self.late += 1
+            if self._skips_in_row < self.max_skips:
+                render = False
+        if render:
+            self._skips_in_row = 0
+        else:
+            self._skips_in_row += 1
+            self.skipped += 1
+
+        self.deadline += period
+        if now - self.deadline > self.resync * period:
+            self.deadline = now + period
+        return dt, render
+
+    def next_delay(self, max_throughput=False):
+        """Milliseconds to pass to after() so the next frame starts on its deadline."""
+        if max_throughput or self.deadline is None:
+            return 0
+        return max(0, int(round((self.deadline - self.clock()) * 1000.0)))
+
+    @property
+    def fps(self):
+        return 1.0 / self.frame_time if self.frame_time > 0 else 0.0
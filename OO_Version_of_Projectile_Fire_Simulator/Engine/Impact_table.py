@@ -0,0 +1,225 @@
+"""
+Precomputed impact lookup table for aim-assist / preview.
+
+For fixed GRAVITY, AIR_DRAG and world geometry, every shot on a grid of
+launch angle x PROJECTILE_SPEED x WIND is flown once (all of them together,
+vectorised, with the Projectile.step update) and the first ground contact
+(x and time of flight) is stored. Shots that leave the world first store NaN.
+
+The table lives in a file that is memory-mapped when opened, so it is ready
+immediately and the pages are shared by every process that opens it. The file
+name is derived from a hash of the physics constants and the grid, so changing
+a constant simply points at a different file (built on first use).
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except Exception:
+    HAS_NUMPY = False
+
+
+VERSION = 1
+MAGIC = b"IMPACTLUT\n"
+HEADER = 4096  # bytes reserved for magic + json header, data starts after it
+
+# (low, high, count) of every axis
+DEFAULT_GRID = {
+    "angle": (-1.55, 0.35, 191),
+    "speed": (200.0, 2000.0, 37),
+    "wind": (-200.0, 200.0, 21),
+}
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "projectile_sim")
+
+
+def _axes(grid):
+    return [np.linspace(*grid[name]) for name in ("angle", "speed", "wind")]
+
+
+def fly(angles, speeds, winds, gravity, drag, origin, ground_y, bounds, dt, max_time=30.0):
+    """
+    Vectorised Projectile.step over broadcastable angle/speed/wind arrays.
+    Returns (impact_x, time_of_flight) at the first ground contact, NaN if the shot
+    left bounds (x0, y0, x1, y1) first.
+    """
+    angles, speeds, winds = np.broadcast_arrays(
+        np.asarray(angles, dtype=np.float64), np.asarray(speeds, dtype=np.float64), np.asarray(winds, dtype=np.float64)
+    )
+    shape = angles.shape
+    a = angles.ravel()
+    s = speeds.ravel()
+    w = winds.ravel()
+    n = a.size
+    x = np.full(n, float(origin[0]))
+    y = np.full(n, float(origin[1]))
+    vx = np.cos(a) * s
+    vy = np.sin(a) * s
+    impact_x = np.full(n, np.nan)
+    tof = np.full(n, np.nan)
+    idx = np.arange(n)  # shots still in the air
+    f = 1.0 - (1.0 - drag) * dt * 60.0
+    x0, y0, x1, y1 = bounds
+    t = 0.0
+    for _ in range(int(max_time / dt)):
+        if idx.size == 0:
+            break
+        # same order of operations as Projectile.step
+        vx += w * dt
+        vy += gravity * dt
+        vx *= f
+        vy *= f
+        x += vx * dt
+        y += vy * dt
+        t += dt
+        ground = y >= ground_y
+        out = (x < x0) | (x > x1) | (y < y0) | (y > y1)
+        done = ground | out
+        if done.any():
+            hit = idx[ground]
+            impact_x[hit] = x[ground]
+            tof[hit] = t
+            keep = ~done
+            idx, x, y, vx, vy, w = idx[keep], x[keep], y[keep], vx[keep], vy[keep], w[keep]
+    return impact_x.reshape(shape), tof.reshape(shape)
+
+
+def _fill(path, header_len, shape, lo, hi, axes, physics):
+    # worker: fly the angle rows lo:hi and write them straight into the shared file
+    angles, speeds, winds = axes
+    ix, tf = fly(angles[lo:hi, None, None], speeds[None, :, None], winds[None, None, :], **physics)
+    data = np.memmap(path, dtype=np.float32, mode="r+", offset=header_len, shape=shape)
+    data[0, lo:hi] = ix
+    data[1, lo:hi] = tf
+    data.flush()
+    return hi - lo
+
+
+class ImpactTable:
+    def __init__(self, path, meta, data):
+        self.path = path
+        self.meta = meta
+        self.data = data  # memmap (2, angles, speeds, winds): impact_x, time of flight
+        self.axes = [np.array(ax) for ax in meta["axes"]]
+        self.lo = np.array([ax[0] for ax in self.axes])
+        self.step = np.array([ax[1] - ax[0] for ax in self.axes])
+        self.count = np.array([len(ax) for ax in self.axes])
+
+    @staticmethod
+    def physics(gravity, drag, origin, ground_y, bounds, dt=1.0 / 60.0):
+        return {
+            "gravity": float(gravity),
+            "drag": float(drag),
+            "origin": [float(origin[0]), float(origin[1])],
+            "ground_y": float(ground_y),
+            "bounds": [float(v) for v in bounds],
+            "dt": float(dt),
+        }
+
+    @staticmethod
+    def key(physics, grid):
+        blob = json.dumps({"v": VERSION, "physics": physics, "grid": grid}, sort_keys=True)
+        return hashlib.sha1(blob.encode()).hexdigest()[:20]
+
+    @classmethod
+    def open(cls, physics, grid=None, cache_dir=None, workers=None):
+        """Map the table for these constants, building (and persisting) it first if needed."""
+        if not HAS_NUMPY:
+            raise RuntimeError("ImpactTable needs numpy (python -m pip install numpy)")
+        grid = {k: list(v) for k, v in (grid or DEFAULT_GRID).items()}
+        cache_dir = cache_dir or DEFAULT_CACHE_DIR
+        key = cls.key(physics, grid)
+        path = os.path.join(cache_dir, "impact_%s.lut" % key)
+        table = cls._load(path, key)
+        if table is None:
+            cls.build(path, key, physics, grid, workers)
+            table = cls._load(path, key)
+        return table
+
+    @classmethod
+    def _load(cls, path, key):
+        try:
+            with open(path, "rb") as fh:
+                head = fh.read(HEADER)
+        except OSError:
+            return None
+        if not head.startswith(MAGIC):
+            return None
+        try:
+            meta = json.loads(head[len(MAGIC) :].rstrip(b"\0"))
+        except ValueError:
+            return None
+        if meta.get("key") != key or meta.get("version") != VERSION:
+            return None
+        data = np.memmap(path, dtype=np.float32, mode="r", offset=HEADER, shape=tuple(meta["shape"]))
+        return cls(path, meta, data)
+
+    @classmethod
+    def build(cls, path, key, physics, grid, workers=None):
+        axes = _axes(grid)
+        shape = (2,) + tuple(len(ax) for ax in axes)
+        meta = {
+            "version": VERSION,
+            "key": key,
+            "physics": physics,
+            "grid": grid,
+            "axes": [ax.tolist() for ax in axes],
+            "shape": list(shape),
+        }
+        head = MAGIC + json.dumps(meta).encode()
+        if len(head) > HEADER:
+            raise ValueError("grid too large for the table header")
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(head.ljust(HEADER, b"\0"))
+                fh.truncate(HEADER + int(np.prod(shape)) * 4)
+            fly_kw = dict(physics, origin=tuple(physics["origin"]))
+            n = shape[1]
+            workers = workers if workers is not None else (os.cpu_count() or 1)
+            if workers > 1:
+                rows = -(-n // (workers * 4))
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    jobs = [
+                        pool.submit(_fill, tmp, HEADER, shape, lo, min(lo + rows, n), axes, fly_kw)
+                        for lo in range(0, n, rows)
+                    ]
+                    for job in jobs:
+                        job.result()
+            else:
+                _fill(tmp, HEADER, shape, 0, n, axes, fly_kw)
+            os.replace(tmp, path)  # readers only ever see a finished table
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+
+    def lookup(self, angle, speed, wind):
+        """Trilinear interpolation; returns (impact_x, time_of_flight), NaN outside the grid or for lost shots."""
+        q = np.stack(np.broadcast_arrays(
+            np.asarray(angle, dtype=np.float64), np.asarray(speed, dtype=np.float64), np.asarray(wind, dtype=np.float64)
+        ), axis=-1)
+        u = (q - self.lo) / self.step
+        inside = np.all((u >= 0) & (u <= self.count - 1), axis=-1)
+        i0 = np.clip(np.floor(u).astype(np.int64), 0, self.count - 2)
+        f = np.clip(u - i0, 0.0, 1.0)
+        ia, is_, iw = i0[..., 0], i0[..., 1], i0[..., 2]
+        fa, fs, fw = f[..., 0:1], f[..., 1:2], f[..., 2:3]
+        d = self.data
+        out = 0.0
+        for da, wa in ((0, 1 - fa), (1, fa)):
+            for ds, ws in ((0, 1 - fs), (1, fs)):
+                for dw, ww in ((0, 1 - fw), (1, fw)):
+                    corner = np.moveaxis(d[:, ia + da, is_ + ds, iw + dw], 0, -1)
+                    out = out + corner * (wa * ws * ww)
+        out = np.where(inside[..., None], out, np.nan)
+        return out[..., 0], out[..., 1]
@@ -0,0 +1,111 @@
+"""
+Offline (headless, faster than real time) rendering of scripted sessions.
+
+The simulation runs in this process at a fixed dt and every frame is recorded
+as a list of draw ops (RecordingRenderer). Rasterising + encoding is fanned out
+to a process pool; results are collected in submission order so frame N is
+always written as frame N.
+"""
+
+import os
+import random
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from .Simulator_class import Simulator
+from .Renderer_class import RecordingRenderer, replay
+from .Raster_renderer_class import RasterRenderer, encode_png, encode_ppm
+
+
+FORMATS = ("png", "ppm", "rgb")  # rgb = one raw rgb24 video stream (ffmpeg -f rawvideo)
+
+_worker_renderer = None  # one raster buffer per worker process, reused between frames
+
+
+def rasterize_frame(ops, width, height, fmt, path=None):
+    """Rasterise one recorded frame and encode it; writes to path if given, else returns the bytes."""
+    global _worker_renderer
+    if _worker_renderer is None:
+        _worker_renderer = RasterRenderer(width, height)
+    frame = replay(ops, _worker_renderer)
+    if fmt == "png":
+        data = encode_png(frame)
+    elif fmt == "ppm":
+        data = encode_ppm(frame)
+    else:
+        data = frame.tobytes()
+    if path is None:
+        return data
+    with open(path, "wb") as f:
+        f.write(data)
+    return path
+
+
+def record_session(script, frames, fps=60, seed=0, configure=None):
+    """
+    Step a headless Simulator for `frames` frames at a fixed dt of 1/fps and
+    yield the recorded draw ops of every frame.
+    script(sim, frame_index) is called before each step to aim/fire/hold.
+    configure(sim) can set the physics parameters, like App.run does.
+    """
+    random.seed(seed)
+    sim = Simulator(None)
+    if configure is not None:
+        configure(sim)
+    dt = 1.0 / fps
+    rec = RecordingRenderer()
+    for i in range(frames):
+        script(sim, i)
+        sim.step_sim(dt)
+        sim.update_camera(dt)
+        yield sim.render(rec)
+
+
+def render_session(script, out, frames, fps=60, fmt="png", workers=None, seed=0, configure=None, ahead=4):
+    """
+    Render a scripted session to out/frame_00000.<fmt> (png/ppm) or to the single
+    raw video file `out` (rgb). Returns a small stats dict.
+    """
+    if fmt not in FORMATS:
+        raise ValueError("format must be one of %s" % (FORMATS,))
+    workers = workers or os.cpu_count() or 1
+    if fmt != "rgb":
+        os.makedirs(out, exist_ok=True)
+    video = open(out, "wb") if fmt == "rgb" else None
+
+    size = None
+    pending = deque()  # futures in frame order, bounded so recording can't run away from the pool
+    written = 0
+    t0 = time.perf_counter()
+
+    def drain(limit):
+        nonlocal written
+        while len(pending) > limit:
+            result = pending.popleft().result()
+            if video is not None:
+                video.write(result)
+            written += 1
+
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for i, ops in enumerate(record_session(script, frames, fps, seed, configure)):
+                if size is None:
+                    size = ops[0][1]  # ("begin_frame", (width, height))
+                path = None if video is not None else os.path.join(out, "frame_%05d.%s" % (i, fmt))
+                pending.append(pool.submit(rasterize_frame, ops, size[0], size[1], fmt, path))
+                drain(workers * ahead)
+            drain(0)
+    finally:
+        if video is not None:
+            video.close()
+
+    wall = time.perf_counter() - t0
+    return {
+        "frames": written,
+        "size": size,
+        "format": fmt,
+        "wall_s": wall,
+        "render_fps": written / wall if wall > 0 else 0.0,
+        "realtime_x": (written / fps) / wall if wall > 0 else 0.0,
+    }
@@ -0,0 +1,178 @@
+import math
+
+
+class ParticleBudget:
+    """
+    Keeps the particle list under MAX_PARTICLES by making room instead of
+    dropping the newest particles.
+
+    A burst asks for all its particles at once. When they do not fit, one pass
+    over the list frees a whole batch of slots (evict_fraction of the limit, or
+    the burst if that is bigger): first dense clusters are merged into fewer,
+    larger particles, then the lowest-priority particles are evicted, off-screen
+    ones first, then by how much of their life is spent, then by size.
+    Priorities are bucketed instead of sorted, so a pass is O(n) and there is
+    at most one pass per burst, however many of its particles are rejected.
+
+    Particles younger than `fresh` (fraction of their life) are never merged or
+    evicted, so a burst that was just spawned cannot eat itself; if nothing else
+    can go, the rest of the burst is rejected.
+
+    A merged particle keeps the total area of its members, and never gets more
+    members than fit in a particle of max_size.
+
+    Sleeping (settled) particles share the budget and are always made room from
+    first, without the fresh-particle protection.
+    """
+
+    BUCKETS = 32
+
+    def __init__(self, evict_fraction=0.125, merge=True, cell=10.0, merge_min=3, max_size=10.0, fresh=0.1):
+        self.evict_fraction = evict_fraction
+        self.merge = merge
+        self.cell = cell
+        self.merge_min = merge_min
+        self.max_size = max_size
+        self.fresh = fresh
+        self.evicted = 0
+        self.merged = 0
+        self.rejected = 0
+
+    def admit(self, particles, limit, view, sleeping=(), count=1):
+        """How many of `count` new particles fit, making room once if needed; the rest count as rejected."""
+        room = limit - len(particles) - len(sleeping)
+        if room < count and limit > 0:
+            self.make_room(particles, limit, view, sleeping, count)
+            room = limit - len(particles) - len(sleeping)
+        granted = max(0, min(count, room))
+        self.rejected += count - granted
+        return granted
+
+    def make_room(self, particles, limit, view, sleeping=(), count=1):
+        goal = limit - min(limit, max(count, int(limit * self.evict_fraction), 1))
+        for group, fresh in ((sleeping, 0.0), (particles, self.fresh)):
+            need = len(particles) + len(sleeping) - goal
+            if need <= 0 or not group:
+                continue
+            if self.merge:
+                self._merge(group, need, view, fresh)
+                need = len(particles) + len(sleeping) - goal
+            if need > 0:
+                self._evict(group, min(need, len(group)), view, fresh)
+
+    def _merge(self, particles, need, view, fresh):
+        # grid-hash the older, visible particles by cell
+        x0, y0, x1, y1 = view
+        cell = self.cell
+        cells = {}
+        for i, q in enumerate(particles):
+            if q.life < q.max_life * (1.0 - fresh) and x0 <= q.x <= x1 and y0 <= q.y <= y1:
+                key = (int(q.x // cell), int(q.y // cell))
+                members = cells.get(key)
+                if members is None:
+                    cells[key] = [i]
+                else:
+                    members.append(i)
+
+        # fold a crowded cell in groups whose total area fits max_size, until `need` slots are free
+        cap = self.max_size * self.max_size
+        drop = set()
+        freed = 0
+        for members in cells.values():
+            if len(members) < self.merge_min:
+                continue
+            group = []
+            area = 0.0
+            for i in members:
+                a = particles[i].size * particles[i].size
+                if area + a > cap:
+                    freed += self._fold(particles, group, drop)
+                    group = []
+                    area = 0.0
+                    if freed >= need:
+                        break
+                group.append(i)
+                area += a
+                if freed + len(group) - 1 >= need:
+                    break
+            freed += self._fold(particles, group, drop)
+            if freed >= need:
+                break
+
+        if drop:
+            particles[:] = [q for i, q in enumerate(particles) if i not in drop]
+
+    def _fold(self, particles, group, drop):
+        # merge the group into its first member, weighted by area so the total area is kept
+        k = len(group)
+        if k < 2:
+            return 0
+        w = x = y = vx = vy = life = max_life = 0.0
+        big = None
+        for i in group:
+            q = particles[i]
+            a = q.size * q.size
+            w += a
+            x += q.x * a
+            y += q.y * a
+            vx += q.vx * a
+            vy += q.vy * a
+            life += q.life
+            max_life += q.max_life
+            if big is None or q.size > big.size:
+                big = q
+        head = particles[group[0]]
+        head.x = x / w
+        head.y = y / w
+        head.vx = vx / w
+        head.vy = vy / w
+        head.life = life / k
+        head.max_life = max_life / k
+        head.col = big.col
+        head.size = math.sqrt(w)  # <= max_size, the group was cut to fit
+        drop.update(group[1:])
+        self.merged += k - 1
+        return k - 1
+
+    def _evict(self, particles, need, view, fresh):
+        x0, y0, x1, y1 = view
+        top = self.BUCKETS - 1
+        max_size = self.max_size
+        # score in [0, 2): +1 off-screen, then 3/4 spent life + 1/4 smallness; -1 = protected
+        buckets = []
+        counts = [0] * self.BUCKETS
+        for q in particles:
+            spent = 1.0 - q.life / q.max_life if q.max_life > 0 else 1.0
+            if not (x0 <= q.x <= x1 and y0 <= q.y <= y1):
+                score = 1.0 + min(spent, 1.0) * 0.999
+            elif spent < fresh:
+                buckets.append(-1)
+                continue
+            else:
+                score = min(spent, 1.0) * 0.75 + (1.0 - min(q.size / max_size, 1.0)) * 0.249
+            b = int(score * 0.5 * self.BUCKETS)
+            if b > top:
+                b = top
+            buckets.append(b)
+            counts[b] += 1
+
+        # lowest bucket that still has to go entirely, and how many to take from the boundary one
+        cut = top
+        left = need
+        while cut >= 0 and counts[cut] < left:
+            left -= counts[cut]
+            cut -= 1
+        if cut < 0:
+            left = 0  # not enough evictable particles: everything but the protected ones goes
+
+        kept = []
+        removed = 0
+        for q, b in zip(particles, buckets):
+            if b > cut or (b == cut and left > 0):
+                if b == cut:
+                    left -= 1
+                removed += 1
+            else:
+                kept.append(q)
+        particles[:] = kept
+        self.evicted += removed
@@ -3,7 +3,7 @@ from .Projectile_class import Projectile
 class Particle(Projectile):
     __slots__ = ("x", "y", "vx", "vy", "life", "max_life", "size", "col","_alive") #added _alive to the slots
 
-    def __init__(self, x, y, vx, vy, life, size, col):
+    def __init__(self, x, y, vx, vy, life, size, col, GRAVITY=700.0, WIND=0.0):
         self.x = x
         self.y = y
         self.vx = vx
@@ -12,16 +12,30 @@ class Particle(Projectile):
         self.max_life = life
         self.size = size
         self.col = col
-        super().__init__(x,y,vx,vy)   #--> super for attributes accessing and calling parent init
+        super().__init__(x,y,vx,vy,GRAVITY=GRAVITY,WIND=WIND)   #--> super for attributes accessing and calling parent init
         
 
-    def step(self, dt):
-        self.vy += self.GRAVITY * dt * 0.1  # very light gravity on particles
-        self.vx += self.WIND * dt * 0.3  # particles affected a bit by wind
+    def step(self, dt, wind=None, wind_y=0.0):
+        if wind is None:
+            wind = self.WIND
+        self.vy += self.GRAVITY * dt * 0.1 + wind_y * dt * 0.3  # very light gravity on particles
+        self.vx += wind * dt * 0.3  # particles affected a bit by wind
         self.x += self.vx * dt
         self.y += self.vy * dt
         self.life -= dt
 
+    def ground_contact(self, ground_y, restitution, friction, sleep_speed):
+        # bounce off the ground losing energy and slide with friction; True once it has come to rest
+        self.y = ground_y
+        if self.vy > 0:
+            self.vy = -self.vy * restitution
+        self.vx *= friction
+        if abs(self.vy) < sleep_speed and abs(self.vx) < sleep_speed:
+            self.vx = 0.0
+            self.vy = 0.0
+            return True
+        return False
+
     @property  #--> implemented the property for alive so that it can be true or false in projectile class
     def alive(self):
         return self.life > 0
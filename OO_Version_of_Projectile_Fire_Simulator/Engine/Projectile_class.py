@@ -58,10 +58,13 @@ class Projectile:
 
 
 
-    def step(self, dt):
+    def step(self, dt, wind=None, wind_y=0.0):
         # Apply wind and gravity; drag multiplicative
-        self.vx += self.WIND * dt
-        self.vy += self.GRAVITY * dt
+        # wind/wind_y: local wind field sample, the uniform WIND is used when not given
+        if wind is None:
+            wind = self.WIND
+        self.vx += wind * dt
+        self.vy += self.GRAVITY * dt + wind_y * dt
         # simple drag
         self.vx *= 1.0 - (1.0 - self.AIR_DRAG) * dt * 60.0
         self.vy *= 1.0 - (1.0 - self.AIR_DRAG) * dt * 60.0
@@ -0,0 +1,288 @@
+import math
+import struct
+import zlib
+
+from .Renderer_class import Renderer
+
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except Exception:
+    HAS_NUMPY = False
+
+
+NAMED_COLORS = {
+    "black": (0, 0, 0),
+    "white": (255, 255, 255),
+    "red": (255, 0, 0),
+    "lightgreen": (144, 238, 144),
+}
+
+# 3x5 bitmap font, rows top to bottom. Lower case is drawn as upper case.
+FONT_3X5 = {
+    "A": "010101111101101", "B": "110101110101110", "C": "011100100100011",
+    "D": "110101101101110", "E": "111100110100111", "F": "111100110100100",
+    "G": "011100101101011", "H": "101101111101101", "I": "111010010010111",
+    "J": "001001001101010", "K": "101101110101101", "L": "100100100100111",
+    "M": "101111111101101", "N": "110101101101101", "O": "010101101101010",
+    "P": "110101110100100", "Q": "010101101110011", "R": "110101110101101",
+    "S": "011100010001110", "T": "111010010010010", "U": "101101101101111",
+    "V": "101101101101010", "W": "101101111111101", "X": "101101010101101",
+    "Y": "101101010010010", "Z": "111001010100111",
+    "0": "111101101101111", "1": "010110010010111", "2": "110001010100111",
+    "3": "110001010001110", "4": "101101111001001", "5": "111100110001110",
+    "6": "011100111101111", "7": "111001010010010", "8": "111101111101111",
+    "9": "111101111001110",
+    ".": "000000000000010", ",": "000000000010100", ":": "000010000010000",
+    "/": "001001010100100", "-": "000000111000000", "=": "000111000111000",
+    "[": "110100100100110", "]": "011001001001011", "(": "010100100100010",
+    ")": "010001001001010", "%": "101001010100101", "+": "000010111010000",
+    " ": "000000000000000",
+}
+
+
+def parse_color(col):
+    if col.startswith("#"):
+        return (int(col[1:3], 16), int(col[3:5], 16), int(col[5:7], 16))
+    return NAMED_COLORS.get(col.lower(), (255, 255, 255))
+
+
+class RasterRenderer(Renderer):
+    """
+    Offscreen software rasteriser into an (height, width, 3) uint8 NumPy array.
+    Shapes match the Tk canvas closely enough for review; flames are drawn as
+    straight thick segments instead of Tk's smoothed splines.
+    """
+
+    def __init__(self, width, height, text_scale=2):
+        if not HAS_NUMPY:
+            raise RuntimeError("RasterRenderer needs numpy (python -m pip install numpy)")
+        self.width = int(width)
+        self.height = int(height)
+        self.text_scale = text_scale
+        self.frame = np.zeros((self.height, self.width, 3), dtype=np.uint8)
+        self._colors = {}
+        self._texts = {}
+        self._background = None
+        self._stamps = {}
+
+    def _rgb(self, col):
+        rgb = self._colors.get(col)
+        if rgb is None:
+            rgb = self._colors[col] = np.array(parse_color(col), dtype=np.uint8)
+        return rgb
+
+    def _box(self, x0, y0, x1, y1):
+        # clip a float box to integer pixel bounds, None if empty
+        ix0 = max(int(x0), 0)
+        iy0 = max(int(y0), 0)
+        ix1 = min(int(x1) + 1, self.width)
+        iy1 = min(int(y1) + 1, self.height)
+        if ix0 >= ix1 or iy0 >= iy1:
+            return None
+        return ix0, iy0, ix1, iy1
+
+    def fill_rect(self, x0, y0, x1, y1, col):
+        box = self._box(x0, y0, x1 - 1, y1 - 1)
+        if box is not None:
+            ix0, iy0, ix1, iy1 = box
+            self.frame[iy0:iy1, ix0:ix1] = self._rgb(col)
+
+    def fill_circle(self, x, y, r, col, inner=None):
+        # inner: draw a ring between inner and r instead of a disc
+        box = self._box(x - r, y - r, x + r, y + r)
+        if box is None:
+            return
+        ix0, iy0, ix1, iy1 = box
+        yy, xx = np.ogrid[iy0:iy1, ix0:ix1]
+        d2 = (xx + 0.5 - x) ** 2 + (yy + 0.5 - y) ** 2
+        mask = d2 <= r * r
+        if inner is not None:
+            mask &= d2 >= inner * inner
+        self.frame[iy0:iy1, ix0:ix1][mask] = self._rgb(col)
+
+    def thick_line(self, x0, y0, x1, y1, w, col):
+        h = w * 0.5
+        box = self._box(min(x0, x1) - h, min(y0, y1) - h, max(x0, x1) + h, max(y0, y1) + h)
+        if box is None:
+            return
+        ix0, iy0, ix1, iy1 = box
+        yy, xx = np.ogrid[iy0:iy1, ix0:ix1]
+        px = xx + 0.5 - x0
+        py = yy + 0.5 - y0
+        dx = x1 - x0
+        dy = y1 - y0
+        L2 = dx * dx + dy * dy
+        if L2 < 1e-12:
+            t = 0.0
+        else:
+            t = np.clip((px * dx + py * dy) / L2, 0.0, 1.0)
+        ex = px - t * dx
+        ey = py - t * dy
+        mask = ex * ex + ey * ey <= h * h
+        self.frame[iy0:iy1, ix0:ix1][mask] = self._rgb(col)
+
+    def _text_mask(self, s):
+        # boolean bitmap of a whole string, cached: the HUD strings rarely change between frames
+        mask = self._texts.get(s)
+        if mask is None:
+            k = self.text_scale
+            lines = s.split("\n")
+            mask = np.zeros((len(lines) * 7 - 2, max(max(len(line) for line in lines) * 4 - 1, 1)), dtype=bool)
+            for row, line in enumerate(lines):
+                for i, ch in enumerate(line):
+                    glyph = FONT_3X5.get(ch)
+                    if glyph is not None:
+                        mask[row * 7 : row * 7 + 5, i * 4 : i * 4 + 3] = np.array([c == "1" for c in glyph]).reshape(5, 3)
+            mask = np.kron(mask, np.ones((k, k), dtype=bool))
+            if len(self._texts) > 256:
+                self._texts.clear()
+            self._texts[s] = mask
+        return mask
+
+    def text(self, x, y, s, col, anchor="center"):
+        mask = self._text_mask(s.upper())
+        th, tw = mask.shape
+        if "w" in anchor:
+            left = x
+        elif "e" in anchor:
+            left = x - tw
+        else:
+            left = x - tw / 2
+        if "n" in anchor:
+            top = y
+        elif "s" in anchor:
+            top = y - th
+        else:
+            top = y - th / 2
+        left = int(left)
+        top = int(top)
+        box = self._box(left, top, left + tw - 1, top + th - 1)
+        if box is None:
+            return
+        ix0, iy0, ix1, iy1 = box
+        sub = mask[iy0 - top : iy1 - top, ix0 - left : ix1 - left]
+        self.frame[iy0:iy1, ix0:ix1][sub] = self._rgb(col)
+
+    # -- Renderer interface --
+
+    def begin_frame(self, width, height):
+        # no clear needed, draw_background overwrites every pixel
+        if int(width) != self.width or int(height) != self.height:
+            self.__init__(width, height, self.text_scale)
+
+    def draw_background(self, width, height, ground_y):
+        key = (width, height, ground_y)
+        if self._background is None or self._background[0] != key:
+            self.fill_rect(0, 0, width, height, "black")
+            self.fill_rect(0, ground_y, width, height, "#1b1b1b")
+            self._background = (key, self.frame.copy())
+        else:
+            np.copyto(self.frame, self._background[1])
+
+    def draw_target(self, x, y, r):
+        self.fill_circle(x, y, r, "#7a0f0f")
+        self.fill_circle(x, y, r + 1, "red", inner=r - 1)
+        self.text(x, y, "TARGET", "#ffd7d7")
+
+    def draw_particles(self, items):
+        if not items:
+            return
+        # one vectorised splat for every spark: stamp offsets x particles, masked by radius
+        xs = np.fromiter((it[0] for it in items), dtype=np.float64, count=len(items))
+        ys = np.fromiter((it[1] for it in items), dtype=np.float64, count=len(items))
+        rs = np.fromiter((it[2] for it in items), dtype=np.float64, count=len(items))
+        cols = np.array([self._rgb(it[3]) for it in items], dtype=np.uint8)
+        # particles are grouped by whole-pixel radius and each group gets a stamp just big enough
+        # for it, so one large (merged or zoomed) particle does not make every spark pay for its stamp
+        radii = np.ceil(rs).astype(np.int64)
+        groups = np.unique(radii)
+        all_py = []
+        all_px = []
+        owners = []
+        for r in groups.tolist():
+            sel = np.nonzero(radii == r)[0] if len(groups) > 1 else np.arange(len(items))
+            stamp = self._stamps.get(r + 1)
+            if stamp is None:
+                oy, ox = np.mgrid[-r - 1 : r + 2, -r - 1 : r + 2]
+                stamp = self._stamps[r + 1] = (ox.ravel(), oy.ravel())
+            gx = xs[sel]
+            gy = ys[sel]
+            px = np.floor(gx)[:, None].astype(np.int64) + stamp[0]
+            py = np.floor(gy)[:, None].astype(np.int64) + stamp[1]
+            d2 = (px + 0.5 - gx[:, None]) ** 2 + (py + 0.5 - gy[:, None]) ** 2
+            mask = (d2 <= (rs[sel] ** 2)[:, None]) & (px >= 0) & (px < self.width) & (py >= 0) & (py < self.height)
+            i, j = np.nonzero(mask)
+            all_py.append(py[i, j])
+            all_px.append(px[i, j])
+            owners.append(sel[i])
+        py = np.concatenate(all_py)
+        px = np.concatenate(all_px)
+        owner = np.concatenate(owners)
+        if len(groups) > 1:
+            # back into draw order: later particles overwrite earlier ones, like canvas stacking order
+            order = np.argsort(owner, kind="stable")
+            py, px, owner = py[order], px[order], owner[order]
+        self.frame[py, px] = cols[owner]
+
+    def draw_flame(self, flat, col, width):
+        for i in range(0, len(flat) - 2, 2):
+            self.thick_line(flat[i], flat[i + 1], flat[i + 2], flat[i + 3], width, col)
+
+    def draw_projectile(self, x, y):
+        self.fill_circle(x, y, 4, "white")
+        self.fill_circle(x, y, 8, "#FF6F3C")
+
+    def draw_cannon(self, ox, oy, bx, by):
+        self.thick_line(ox, oy, bx, by, 10, "#666666")
+        self.fill_circle(ox, oy, 10, "#444444")
+
+    def draw_hud(self, width, height, wind_label, hint, debug_text=None):
+        self.text(12, height - 24, wind_label, "white", anchor="w")
+        self.text(12, 12, hint, "white", anchor="nw")
+        if debug_text is not None:
+            self.text(width - 12, 12, debug_text, "lightgreen", anchor="ne")
+
+    def draw_impact_marker(self, x, y):
+        self.thick_line(x - 8, y - 8, x + 8, y + 8, 2, "lightgreen")
+        self.thick_line(x - 8, y + 8, x + 8, y - 8, 2, "lightgreen")
+
+    def draw_wind_arrows(self, segments):
+        for x0, y0, x1, y1 in segments:
+            self.thick_line(x0, y0, x1, y1, 1, "#3c6e9e")
+            # small head: two short strokes back from the tip
+            dx = x1 - x0
+            dy = y1 - y0
+            d = math.hypot(dx, dy)
+            if d > 3:
+                ux = dx / d * 5
+                uy = dy / d * 5
+                self.thick_line(x1, y1, x1 - ux - uy * 0.6, y1 - uy + ux * 0.6, 1, "#3c6e9e")
+                self.thick_line(x1, y1, x1 - ux + uy * 0.6, y1 - uy - ux * 0.6, 1, "#3c6e9e")
+
+    def end_frame(self):
+        return self.frame
+
+
+def encode_ppm(frame):
+    h, w = frame.shape[:2]
+    return b"P6\n%d %d\n255\n" % (w, h) + frame.tobytes()
+
+
+def encode_png(frame, level=3):
+    h, w = frame.shape[:2]
+
+    def chunk(tag, data):
+        body = tag + data
+        return struct.pack(">I", len(data)) + body + struct.pack(">I", zlib.crc32(body) & 0xFFFFFFFF)
+
+    # filter type 0 (none) at the start of every scanline
+    raw = np.zeros((h, w * 3 + 1), dtype=np.uint8)
+    raw[:, 1:] = frame.reshape(h, w * 3)
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", struct.pack(">IIBBBBB", w, h, 8, 2, 0, 0, 0))
+        + chunk(b"IDAT", zlib.compress(raw.tobytes(), level))
+        + chunk(b"IEND", b"")
+    )
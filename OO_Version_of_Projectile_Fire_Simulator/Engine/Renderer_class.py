@@ -0,0 +1,213 @@
+from .Tcl_batch_class import CanvasBatch
+
+
+class Renderer:
+    """
+    Backend interface for drawing one frame of the simulator scene.
+    Simulator.render computes all the geometry and calls these in draw order,
+    so a backend only has to know how to put the shapes somewhere.
+    """
+
+    def begin_frame(self, width, height):
+        pass
+
+    def draw_background(self, width, height, ground_y):
+        raise NotImplementedError
+
+    def draw_target(self, x, y, r):
+        raise NotImplementedError
+
+    def draw_particles(self, items):
+        # items: list of (x, y, size, col), back to front
+        raise NotImplementedError
+
+    def draw_flame(self, flat, col, width):
+        # flat: x0, y0, x1, y1, ... polyline
+        raise NotImplementedError
+
+    def draw_projectile(self, x, y):
+        raise NotImplementedError
+
+    def draw_cannon(self, ox, oy, bx, by):
+        raise NotImplementedError
+
+    def draw_hud(self, width, height, wind_label, hint, debug_text=None):
+        raise NotImplementedError
+
+    def draw_impact_marker(self, x, y):
+        # aim-assist: predicted landing point, optional for a backend
+        pass
+
+    def draw_wind_arrows(self, segments):
+        # debug overlay: (x0, y0, x1, y1) per arrow, optional for a backend
+        pass
+
+    def end_frame(self):
+        return None
+
+
+class TkRenderer(Renderer):
+    """Draws onto a tkinter Canvas (the interactive window)."""
+
+    def __init__(self, canvas):
+        self.canvas = canvas
+
+    def begin_frame(self, width, height):
+        self.canvas.delete("all")
+
+    def draw_background(self, width, height, ground_y):
+        c = self.canvas
+        c.create_rectangle(0, 0, width, height, fill="black", outline="")
+        c.create_rectangle(0, ground_y, width, height, fill="#1b1b1b", outline="")
+
+    def draw_target(self, x, y, r):
+        c = self.canvas
+        c.create_oval(x - r, y - r, x + r, y + r, fill="#7a0f0f", outline="red", width=2)
+        c.create_text(x, y, text="TARGET", fill="#ffd7d7", font=("Helvetica", 10))
+
+    def draw_particles(self, items):
+        c = self.canvas
+        for x, y, size, col in items:
+            c.create_oval(x - size, y - size, x + size, y + size, fill=col, outline="")
+
+    def draw_flame(self, flat, col, width):
+        self.canvas.create_line(*flat, fill=col, width=width, smooth=True, splinesteps=6)
+
+    def draw_projectile(self, x, y):
+        c = self.canvas
+        c.create_oval(x - 4, y - 4, x + 4, y + 4, fill="white", outline="")
+        c.create_oval(x - 8, y - 8, x + 8, y + 8, outline="", fill="#FF6F3C")
+
+    def draw_cannon(self, ox, oy, bx, by):
+        c = self.canvas
+        c.create_line(ox, oy, bx, by, fill="#666666", width=10, capstyle="round")
+        c.create_oval(ox - 10, oy - 10, ox + 10, oy + 10, fill="#444444", outline="")
+
+    def draw_hud(self, width, height, wind_label, hint, debug_text=None):
+        c = self.canvas
+        c.create_text(12, height - 24, anchor="w", fill="white", text=wind_label)
+        c.create_text(12, 12, anchor="nw", fill="white", text=hint, font=("Helvetica", 11))
+        if debug_text is not None:
+            c.create_text(width - 12, 12, anchor="ne", fill="lightgreen", text=debug_text)
+
+    def draw_impact_marker(self, x, y):
+        c = self.canvas
+        c.create_line(x - 8, y - 8, x + 8, y + 8, fill="lightgreen", width=2)
+        c.create_line(x - 8, y + 8, x + 8, y - 8, fill="lightgreen", width=2)
+
+    def draw_wind_arrows(self, segments):
+        c = self.canvas
+        for x0, y0, x1, y1 in segments:
+            c.create_line(x0, y0, x1, y1, fill="#3c6e9e", arrow="last")
+
+
+class BatchedTkRenderer(TkRenderer):
+    """
+    Same drawing as TkRenderer, but the whole frame is collected in a CanvasBatch
+    and handed to Tcl in one evaluation at end_frame. Particles go through a
+    Tcl proc that takes one flat list, so thousands of sparks cost one crossing.
+    """
+
+    def __init__(self, canvas):
+        super().__init__(canvas)
+        self.batch = CanvasBatch.for_canvas(canvas)
+
+    def begin_frame(self, width, height):
+        self.batch.delete_all()
+
+    def draw_background(self, width, height, ground_y):
+        b = self.batch
+        b.rectangle(0, 0, width, height, fill="black", outline="")
+        b.rectangle(0, ground_y, width, height, fill="#1b1b1b", outline="")
+
+    def draw_target(self, x, y, r):
+        b = self.batch
+        b.oval(x - r, y - r, x + r, y + r, fill="#7a0f0f", outline="red", width=2)
+        b.text(x, y, text="TARGET", fill="#ffd7d7", font=("Helvetica", 10))
+
+    def draw_particles(self, items):
+        self.batch.ovals(items)
+
+    def draw_flame(self, flat, col, width):
+        self.batch.line(flat, fill=col, width=width, smooth=True, splinesteps=6)
+
+    def draw_projectile(self, x, y):
+        b = self.batch
+        b.oval(x - 4, y - 4, x + 4, y + 4, fill="white", outline="")
+        b.oval(x - 8, y - 8, x + 8, y + 8, outline="", fill="#FF6F3C")
+
+    def draw_cannon(self, ox, oy, bx, by):
+        b = self.batch
+        b.line((ox, oy, bx, by), fill="#666666", width=10, capstyle="round")
+        b.oval(ox - 10, oy - 10, ox + 10, oy + 10, fill="#444444", outline="")
+
+    def draw_hud(self, width, height, wind_label, hint, debug_text=None):
+        b = self.batch
+        b.text(12, height - 24, anchor="w", fill="white", text=wind_label)
+        b.text(12, 12, anchor="nw", fill="white", text=hint, font=("Helvetica", 11))
+        if debug_text is not None:
+            b.text(width - 12, 12, anchor="ne", fill="lightgreen", text=debug_text)
+
+    def draw_impact_marker(self, x, y):
+        b = self.batch
+        b.line((x - 8, y - 8, x + 8, y + 8), fill="lightgreen", width=2)
+        b.line((x - 8, y + 8, x + 8, y - 8), fill="lightgreen", width=2)
+
+    def draw_wind_arrows(self, segments):
+        b = self.batch
+        for seg in segments:
+            b.line(seg, fill="#3c6e9e", arrow="last")
+
+    def end_frame(self):
+        self.batch.flush()
+        return None
+
+
+class RecordingRenderer(Renderer):
+    """
+    Records the draw calls of a frame as plain tuples.
+    The result is picklable, so a frame can be built here and rasterised in another process.
+    """
+
+    def __init__(self):
+        self.ops = []
+
+    def begin_frame(self, width, height):
+        self.ops = [("begin_frame", (width, height))]
+
+    def draw_background(self, *args):
+        self.ops.append(("draw_background", args))
+
+    def draw_target(self, *args):
+        self.ops.append(("draw_target", args))
+
+    def draw_particles(self, items):
+        self.ops.append(("draw_particles", (items,)))
+
+    def draw_flame(self, *args):
+        self.ops.append(("draw_flame", args))
+
+    def draw_projectile(self, *args):
+        self.ops.append(("draw_projectile", args))
+
+    def draw_cannon(self, *args):
+        self.ops.append(("draw_cannon", args))
+
+    def draw_hud(self, *args):
+        self.ops.append(("draw_hud", args))
+
+    def draw_impact_marker(self, *args):
+        self.ops.append(("draw_impact_marker", args))
+
+    def draw_wind_arrows(self, segments):
+        self.ops.append(("draw_wind_arrows", (segments,)))
+
+    def end_frame(self):
+        return self.ops
+
+
+def replay(ops, renderer):
+    # feed recorded ops into any other backend, returns that backend's frame
+    for name, args in ops:
+        getattr(renderer, name)(*args)
+    return renderer.end_frame()
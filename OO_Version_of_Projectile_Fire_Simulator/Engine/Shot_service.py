@@ -0,0 +1,250 @@
+"""
+Local asyncio shot-simulation service.
+
+Speaks newline-delimited JSON over TCP or a Unix socket. One request per line,
+one response line per request (carrying the request "id" back if given):
+
+    {"id": 1, "op": "shot", "angle": -0.6, "speed": 1200, "gravity": 700,
+     "drag": 0.995, "wind": 0, "target": [840, 540, 36]}
+    {"id": 2, "op": "batch", "shots": [{...}, {...}]}
+    {"id": 3, "op": "stats"}
+
+Shots are flown with Ballistics.simulate_shot in an executor (a process pool by
+default) so the event loop stays free for other clients. Results are kept in an
+LRU cache keyed by the quantised parameters; the quantised values are also the
+ones that get simulated, so a cached answer is exactly what a fresh run gives.
+Identical shots that are already in flight are awaited rather than run twice.
+"""
+
+import asyncio
+import json
+import os
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+
+from .Ballistics import lifetime_bounds, simulate_many
+
+
+# parameter -> quantum used for the cache key
+QUANTA = {
+    "angle": 1e-4,
+    "speed": 0.1,
+    "gravity": 0.1,
+    "drag": 1e-5,
+    "wind": 0.1,
+    "target": 0.5,
+}
+MAX_BATCH = 10000
+
+
+class ShotService:
+    def __init__(self, cache_size=4096, executor=None, world=None, chunk=64):
+        self.cache_size = cache_size
+        self.cache = OrderedDict()
+        self.inflight = {}
+        self.executor = executor
+        # geometry shared by every request (Simulator defaults)
+        self.world = world or {"origin": (80, 660), "ground_y": 660, "bounds": lifetime_bounds(1000, 700), "dt": 1.0 / 60.0}
+        self.chunk = chunk
+        self.hits = 0
+        self.misses = 0
+        self.requests = 0
+        self.errors = 0
+        self.clients = 0
+        self.latency = deque(maxlen=2048)
+        self._tasks = set()
+
+    # -- cache --
+
+    def key(self, shot):
+        try:
+            target = shot["target"]
+            if len(target) != 3:
+                raise ValueError("target must be [x, y, r]")
+            return (
+                round(float(shot["angle"]) / QUANTA["angle"]),
+                round(float(shot["speed"]) / QUANTA["speed"]),
+                round(float(shot.get("gravity", 700.0)) / QUANTA["gravity"]),
+                round(float(shot.get("drag", 0.995)) / QUANTA["drag"]),
+                round(float(shot.get("wind", 0.0)) / QUANTA["wind"]),
+            ) + tuple(round(float(v) / QUANTA["target"]) for v in target)
+        except KeyError as e:
+            raise ValueError("missing parameter %s" % e)
+        except TypeError:
+            raise ValueError("parameters must be numbers")
+
+    def params(self, key):
+        qt = QUANTA["target"]
+        kw = dict(
+            angle=key[0] * QUANTA["angle"],
+            speed=key[1] * QUANTA["speed"],
+            gravity=key[2] * QUANTA["gravity"],
+            drag=key[3] * QUANTA["drag"],
+            wind=key[4] * QUANTA["wind"],
+            target=(key[5] * qt, key[6] * qt, key[7] * qt),
+        )
+        kw.update(self.world)
+        return kw
+
+    def _remember(self, key, result):
+        self.cache[key] = result
+        self.cache.move_to_end(key)
+        while len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+
+    # -- solving --
+
+    async def solve(self, shots):
+        """Results for a list of shot dicts, in order; misses are run in the executor in chunks."""
+        loop = asyncio.get_running_loop()
+        keys = [self.key(s) for s in shots]
+        found = {}  # held locally: a big batch can push its own early results out of the LRU
+        waits = {}
+        todo = []
+        for k in keys:
+            if k in waits or k in found:
+                continue
+            if k in self.cache:
+                self.cache.move_to_end(k)
+                found[k] = self.cache[k]
+                self.hits += 1
+            elif k in self.inflight:
+                self.hits += 1
+                waits[k] = self.inflight[k]
+            else:
+                self.misses += 1
+                waits[k] = self.inflight[k] = loop.create_future()
+                todo.append(k)
+
+        for i in range(0, len(todo), self.chunk):
+            part = todo[i : i + self.chunk]
+            try:
+                results = await loop.run_in_executor(self.executor, simulate_many, [self.params(k) for k in part])
+            except BaseException as e:
+                # also on cancellation: nothing may be left in inflight that will never resolve
+                if isinstance(e, asyncio.CancelledError):
+                    e = RuntimeError("shot solve was cancelled")
+                for k in todo[i:]:
+                    fut = self.inflight.pop(k, None)
+                    if fut is not None and not fut.done():
+                        fut.set_exception(e)
+                        fut.exception()  # mark retrieved, the error is reported below
+                raise
+            for k, r in zip(part, results):
+                self._remember(k, r)
+                found[k] = r
+                fut = self.inflight.pop(k, None)
+                if fut is not None and not fut.done():
+                    fut.set_result(r)
+
+        out = []
+        for k in keys:
+            r = found.get(k)
+            if r is None:
+                # shielded: a caller that gives up must not cancel the future other requests share
+                r = await asyncio.shield(waits[k])
+            out.append(r)
+        return out
+
+    async def dispatch(self, req):
+        op = req.get("op", "shot")
+        if op == "shot":
+            return {"result": (await self.solve([req]))[0]}
+        if op == "batch":
+            shots = req.get("shots")
+            if not isinstance(shots, list) or len(shots) > MAX_BATCH:
+                raise ValueError("batch needs a list of at most %d shots" % MAX_BATCH)
+            return {"results": await self.solve(shots)}
+        if op == "stats":
+            return {"stats": self.stats()}
+        raise ValueError("unknown op %r" % op)
+
+    def stats(self):
+        lat = sorted(self.latency)
+        looked_up = self.hits + self.misses
+
+        def pct(q):
+            return lat[min(len(lat) - 1, int(q * len(lat)))] * 1000 if lat else 0.0
+
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "clients": self.clients,
+            "cache_size": len(self.cache),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / looked_up if looked_up else 0.0,
+            "latency_ms": {
+                "mean": sum(lat) / len(lat) * 1000 if lat else 0.0,
+                "p50": pct(0.50),
+                "p95": pct(0.95),
+                "p99": pct(0.99),
+                "max": lat[-1] * 1000 if lat else 0.0,
+            },
+        }
+
+    # -- connections --
+
+    async def handle(self, reader, writer):
+        self.clients += 1
+        mine = set()  # this client's unanswered requests
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                if line.strip():
+                    # one task per line, so a slow batch does not hold up the client's next request
+                    task = asyncio.ensure_future(self._answer(line, writer))
+                    self._tasks.add(task)
+                    task.add_done_callback(self._tasks.discard)
+                    mine.add(task)
+                    task.add_done_callback(mine.discard)
+        finally:
+            self.clients -= 1
+            # let the answers already under way finish, then release the transport
+            if mine:
+                await asyncio.gather(*mine, return_exceptions=True)
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def _answer(self, line, writer):
+        t0 = time.perf_counter()
+        self.requests += 1
+        rid = None
+        try:
+            req = json.loads(line)
+            if not isinstance(req, dict):
+                raise ValueError("request must be a JSON object")
+            rid = req.get("id")
+            resp = await self.dispatch(req)
+            resp["ok"] = True
+        except Exception as e:
+            self.errors += 1
+            resp = {"ok": False, "error": str(e)}
+        if rid is not None:
+            resp["id"] = rid
+        self.latency.append(time.perf_counter() - t0)
+        if writer.is_closing():
+            return
+        writer.write((json.dumps(resp) + "\n").encode())
+        try:
+            await writer.drain()
+        except ConnectionError:
+            pass
+
+
+async def serve(host="127.0.0.1", port=8765, path=None, workers=None, cache_size=4096):
+    """Run the service until cancelled; a Unix socket at `path` is used instead of TCP when given."""
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        service = ShotService(cache_size=cache_size, executor=pool)
+        if path is not None:
+            server = await asyncio.start_unix_server(service.handle, path=path, limit=1 << 24)
+        else:
+            server = await asyncio.start_server(service.handle, host, port, limit=1 << 24)
+        async with server:
+            await server.serve_forever()
@@ -1,10 +1,19 @@
 import tkinter as tk
 import math
-import time
 import random
 import sys
+import threading
+from itertools import repeat
 from .Projectile_class import Projectile
 from .Particle_class import Particle
+from .Renderer_class import BatchedTkRenderer
+from .Fire_scheduler_class import FireScheduler
+from .Particle_budget_class import ParticleBudget
+from .Ballistics import ground_contact, in_target, lifetime_bounds, outside, SETTLE
+from .Impact_table import ImpactTable, HAS_NUMPY
+from .Wind_field_class import WindField
+from .Camera_class import Camera
+from .Frame_pacer_class import FramePacer
 
 
 try:
@@ -26,7 +35,7 @@ else:
 
 
 class Simulator(Projectile):
-    def __init__(self, root):
+    def __init__(self, root=None):
         
         super().__init__(x=0.0,y=0.0,vx=0.0,vy=0.0)  #--> added super to access the attributes and constructor of the parent class projectile
         
@@ -34,29 +43,63 @@ class Simulator(Projectile):
         self.HEIGHT=700
         self.GROUND_Y =self. HEIGHT - 40
         self.TARGET_FPS=60
+        self.MAX_THROUGHPUT = False  # --> benchmark mode: run frames back to back, no frame pacing
         self.PROJECTILE_SPEED=1200.0
         self.MAX_PROJECTILES = 40
         self.MAX_PARTICLES = 800
         self.AUTO_FIRE_RATE = 10.0 
+        self.PARTICLE_EVICTION = True  # --> make room for new particles when MAX_PARTICLES is hit instead of dropping them
+        self.PARTICLE_GROUND_COLLISION = True  # --> sparks bounce on the ground and go to sleep once settled
+        self.PARTICLE_RESTITUTION = 0.35
+        self.PARTICLE_FRICTION = 0.6
+        self.PARTICLE_SLEEP_SPEED = 25.0
+        self.WIND_FIELD = True  # --> spatially varying wind with drifting gusts on top of WIND (needs numpy)
+        self.WORLD_WIDTH = None  # --> world size, None = same as the window (WIDTH/HEIGHT)
+        self.WORLD_HEIGHT = None
+        self.PROJECTILE_BOUNDS = None  # --> (x0, y0, x1, y1) where projectiles stay alive, None = world plus margins
+        self.PARTICLE_BOUNDS = None  # --> same for particles, independent of what the camera shows
 
 
         self.root = root
-        self.canvas = tk.Canvas(root, width=self.WIDTH, height=self.HEIGHT, bg="black")
-        self.canvas.pack()
         self.projectiles = []
         self.particles = []
+        self.sleeping = []  # --> settled particles: aged and drawn, never integrated
         self.target = {"x": self.WIDTH - 160, "y": self.GROUND_Y - 120, "r": 36}
         self.origin = (80,self. GROUND_Y)
         self.mouse = (self.origin[0] + 120, self.origin[1] - 120)
         self.aim_angle = -math.pi / 4
         self.holding_fire = False
-        self.last_auto_fire = 0.0
-        self.last_time = time.time()
+        self.fire_scheduler = FireScheduler()
+        self.particle_budget = ParticleBudget()
+        self.wind_field = None  # --> built on the first step, once the world size is known
+        self.camera = Camera(self.WIDTH, self.HEIGHT)  # --> world -> window transform, pan/zoom/follow
+        self._drag = None
+        self.culled = 0  # --> entities skipped by the last render because they were off-view
+        self.impact_table = None  # --> aim-assist lookup table, loaded/built in the background when first needed
+        self._impact_loading = False
+        self._impact_failed = None  # --> physics whose table could not be loaded, not retried until they change
+        self.frame_pacer = FramePacer()  # --> absolute-deadline scheduling of loop()
         self.show_debug = False
 
+        self.running = True
+        if root is None:  # --> headless: no window and no event loop, the caller drives step_sim/render
+            self.canvas = None
+            self.renderer = None
+            return
+
+        self.canvas = tk.Canvas(root, width=self.WIDTH, height=self.HEIGHT, bg="black")
+        self.canvas.pack()
+        # --> one Tcl evaluation per frame instead of one _tkinter round trip per canvas item
+        self.renderer = BatchedTkRenderer(self.canvas)
+
         # controls
         self.canvas.bind("<Motion>", self.on_mouse_move)
         self.canvas.bind("<Button-1>", self.on_click)
+        self.canvas.bind("<ButtonPress-3>", self.on_pan_start)
+        self.canvas.bind("<B3-Motion>", self.on_pan)
+        self.canvas.bind("<MouseWheel>", self.on_wheel)  # Windows / macOS
+        self.canvas.bind("<Button-4>", self.on_wheel)  # X11 wheel up
+        self.canvas.bind("<Button-5>", self.on_wheel)  # X11 wheel down
         root.bind("<KeyPress>", self.on_key_down)
         root.bind("<KeyRelease>", self.on_key_up)
 
@@ -71,22 +114,37 @@ class Simulator(Projectile):
         )
 
         # start loop
-        self.running = True
         self.loop()
 
     def hint_string(self):
         return (
             "Aim with mouse or arrow keys. Click or Space to fire. Hold Space = rapid fire. "
-            "Wind [ / ]  Toggle debug: D. FPS target: %d" % self.TARGET_FPS
+            "Wind [ / ]  Toggle debug: D. FPS target: %d\n"
+            "Right-drag pan, wheel zoom, F follow shot, C reset view. M: max throughput" % self.TARGET_FPS
         )
 
     def on_mouse_move(self, e):
-        self.mouse = (e.x, e.y)
+        # aim at the world point under the cursor
+        wx, wy = self.camera.to_world(e.x, e.y)
+        self.mouse = (wx, wy)
         ox, oy = self.origin
-        self.aim_angle = math.atan2(e.y - oy, e.x - ox)
+        self.aim_angle = math.atan2(wy - oy, wx - ox)
 
     def on_click(self, e):
-        self.fire(e.x, e.y)
+        self.fire(*self.camera.to_world(e.x, e.y))
+
+    def on_pan_start(self, e):
+        self._drag = (e.x, e.y)
+        self.camera.mode = "free"
+
+    def on_pan(self, e):
+        if self._drag is not None:
+            self.camera.pan(e.x - self._drag[0], e.y - self._drag[1])
+        self._drag = (e.x, e.y)
+
+    def on_wheel(self, e):
+        up = e.num == 4 or getattr(e, "delta", 0) > 0
+        self.camera.zoom_at(1.15 if up else 1 / 1.15, e.x, e.y)
 
     def on_key_down(self, e):
         if e.keysym == "space":
@@ -101,11 +159,18 @@ class Simulator(Projectile):
             self.aim_angle += 0.06
         elif e.keysym == "d" or e.keysym == "D":
             self.show_debug = not self.show_debug
+        elif e.keysym == "f" or e.keysym == "F":
+            self.camera.mode = "free" if self.camera.mode == "follow" else "follow"
+        elif e.keysym == "c" or e.keysym == "C":
+            self.camera.mode = "free"
+            self.camera.zoom = 1.0
+            self.camera.x = self.camera.y = 0.0
+        elif e.keysym == "m" or e.keysym == "M":
+            self.MAX_THROUGHPUT = not self.MAX_THROUGHPUT
         elif e.keysym == "bracketleft":
-            global WIND
-            WIND -= 10
+            self.WIND -= 10
         elif e.keysym == "bracketright":
-            WIND += 10
+            self.WIND += 10
 
     def on_key_up(self, e):
         if e.keysym == "space":
@@ -121,15 +186,28 @@ class Simulator(Projectile):
             return
         vx = dx / d * self.PROJECTILE_SPEED
         vy = dy / d * self.PROJECTILE_SPEED
-        if len(self.projectiles) < self.MAX_PROJECTILES:
-            p = Projectile(ox, oy, vx, vy,GRAVITY=self.GRAVITY,AIR_DRAG=self.AIR_DRAG,WIND=self.WIND)  # --> added gravity airdrag and wind so that the projectile is affected by that conditions
-            self.projectiles.append(p)
+        self.launch(vx, vy)
+
+    def launch(self, vx, vy):
+        # new projectile at the barrel, None when MAX_PROJECTILES is reached
+        if len(self.projectiles) >= self.MAX_PROJECTILES:
+            return None
+        ox, oy = self.origin
+        p = Projectile(ox, oy, vx, vy,GRAVITY=self.GRAVITY,AIR_DRAG=self.AIR_DRAG,WIND=self.WIND)  # --> added gravity airdrag and wind so that the projectile is affected by that conditions
+        self.projectiles.append(p)
+        return p
 
 
 
     def spawn_explosion(self, x, y, power=1.0, color_range=None, num=60):
-        # spawn particles in a burst
-        for i in range(int(num * power)):
+        # spawn particles in a burst; room for the whole burst is decided once, up front
+        n = int(num * power)
+        room = self.MAX_PARTICLES - len(self.particles) - len(self.sleeping)
+        if room < n and self.PARTICLE_EVICTION:
+            room = self.particle_budget.admit(
+                self.particles, self.MAX_PARTICLES, self.camera.visible(), self.sleeping, n
+            )
+        for i in range(n):
             ang = random.random() * math.pi * 2
             speed = random.random() * 300 * math.sqrt(power)
             vx = math.cos(ang) * speed + self.WIND * 0.2
@@ -141,8 +219,70 @@ class Simulator(Projectile):
             g = int(self.clamp(random.randint(50, 180), 0, 255))
             b = 20
             col = "#%02x%02x%02x" % (r, g, b)
-            if len(self.particles) < self.MAX_PARTICLES:
-                self.particles.append(Particle(x, y, vx, vy, life, size, col))
+            if i < room:
+                self.particles.append(Particle(x, y, vx, vy, life, size, col, GRAVITY=self.GRAVITY, WIND=self.WIND))
+
+    def impact_preview(self):
+        """Predicted first ground impact (x, time of flight) of the current aim, None if unknown."""
+        if not HAS_NUMPY:
+            return None
+        physics = ImpactTable.physics(
+            self.GRAVITY, self.AIR_DRAG, self.origin, self.GROUND_Y, self.projectile_bounds(), 1.0 / self.TARGET_FPS
+        )
+        table = self.impact_table
+        if table is None or table.meta["physics"] != physics:
+            # constants changed (or first use): map/build the matching table without blocking the frame
+            if not self._impact_loading and self._impact_failed != physics:
+                self._impact_loading = True
+                threading.Thread(target=self._load_impact_table, args=(physics,), daemon=True).start()
+            return None
+        x, t = table.lookup(self.aim_angle, self.PROJECTILE_SPEED, self.WIND)
+        if math.isnan(x):
+            return None
+        return float(x), float(t)
+
+    def _load_impact_table(self, physics):
+        try:
+            self.impact_table = ImpactTable.open(physics, workers=1)
+        except Exception as e:
+            self._impact_failed = physics
+            print("impact table unavailable: %s" % e)
+        finally:
+            self._impact_loading = False
+
+    def active_wind_field(self):
+        # the wind field when it is switched on and numpy is there, else None (uniform WIND)
+        if not (self.WIND_FIELD and HAS_NUMPY):
+            return None
+        if self.wind_field is None or tuple(self.wind_field.bounds) != tuple(self.projectile_bounds()):
+            # cover everything projectiles can reach before they are culled (rebuilt when the world is resized);
+            # gusts are seeded from the simulation's random stream, so a seeded run is reproducible
+            self.wind_field = WindField(*self.projectile_bounds(), seed=random.getrandbits(32))
+        return self.wind_field
+
+    def world_size(self):
+        return (self.WORLD_WIDTH or self.WIDTH, self.WORLD_HEIGHT or self.HEIGHT)
+
+    def projectile_bounds(self):
+        if self.PROJECTILE_BOUNDS is not None:
+            return self.PROJECTILE_BOUNDS
+        return lifetime_bounds(*self.world_size())
+
+    def particle_bounds(self):
+        if self.PARTICLE_BOUNDS is not None:
+            return self.PARTICLE_BOUNDS
+        ww, wh = self.world_size()
+        return (0, -500, ww * 2, wh + 500)
+
+    def update_camera(self, dt):
+        # follow mode tracks the newest shot; the view is kept inside the world (plus the sky above it)
+        cam = self.camera
+        cam.view_w, cam.view_h = self.WIDTH, self.HEIGHT
+        if self.projectiles:
+            p = self.projectiles[-1]
+            cam.update(dt, (p.x, p.y))
+        ww, wh = self.world_size()
+        cam.clamp(0, self.projectile_bounds()[1], ww, wh)
 
     def clamp(self,v, a, b):
         return max(a, min(b, v))
@@ -150,51 +290,55 @@ class Simulator(Projectile):
     
     
     def step_sim(self, dt):
-        # auto-fire
+        # auto-fire: every shot due in this step, fired along the current aim angle.
+        # A shot that left the barrel `lag` seconds before the end of the step is only stepped by lag.
+        fresh = {}
         if self.holding_fire:
-            now = time.time()
-            if now - self.last_auto_fire >= 1.0 / self.AUTO_FIRE_RATE:
-                # fire along the current aim angle
-                ox, oy = self.origin
-                vx = math.cos(self.aim_angle) * self.PROJECTILE_SPEED
-                vy = math.sin(self.aim_angle) * self.PROJECTILE_SPEED
-                if len(self.projectiles) < self.MAX_PROJECTILES:
-                    p = Projectile(ox, oy, vx, vy,GRAVITY=self.GRAVITY,AIR_DRAG=self.AIR_DRAG,WIND=self.WIND) # --> same as fire method implementation (added gravity airdrag and wind so that the projectile is affected by that conditions)
-                    self.projectiles.append(p)
-                self.last_auto_fire = now
+            vx = math.cos(self.aim_angle) * self.PROJECTILE_SPEED
+            vy = math.sin(self.aim_angle) * self.PROJECTILE_SPEED
+            for lag in self.fire_scheduler.shots_due(dt, self.AUTO_FIRE_RATE):
+                p = self.launch(vx, vy)
+                if p is not None:
+                    fresh[p] = lag
+            self.fire_scheduler.fired += len(fresh)
+        else:
+            self.fire_scheduler.idle(dt, self.AUTO_FIRE_RATE)
+
+        # local wind: one vectorised field sample for all projectiles (and below, all particles)
+        field = self.active_wind_field()
+        winds = repeat((None, 0.0))
+        if field is not None:
+            field.update(dt)
+            if self.projectiles:
+                wu, wv = field.sample([p.x for p in self.projectiles], [p.y for p in self.projectiles], self.WIND)
+                winds = zip(wu.tolist(), wv.tolist())
 
         # step projectiles
         to_remove = []
-        for p in self.projectiles:
-            p.step(dt)
-            # map collisions
-            # ground collision
-            if p.y >= self.GROUND_Y:
-                p.y = self.GROUND_Y
-                # bounce or explode — small bounce with energy loss
-                if abs(p.vy) > 180:
-                    # bounce
-                    p.vy = -p.vy * 0.35
-                    p.vx *= 0.6
-                    # spawn ricochet spark
-                    self.spawn_explosion(p.x, p.y - 6, power=0.4, num=12)
-                else:
-                    # low-speed -> settle and explode
+        bounds = self.projectile_bounds()
+        for p, (wu, wv) in zip(self.projectiles, winds):
+            p.step(fresh.get(p, dt) if fresh else dt, wu, wv)
+            # map collisions (rules live in Ballistics, shared with the headless shot solver)
+            # ground collision: small bounce with energy loss, or settle and explode
+            contact = ground_contact(p, self.GROUND_Y)
+            if contact is not None:
+                if contact == SETTLE:
                     to_remove.append(p)
                     self.spawn_explosion(p.x, p.y, power=1.0, num=40)
+                else:
+                    # spawn ricochet spark
+                    self.spawn_explosion(p.x, p.y - 6, power=0.4, num=12)
                 continue
             # target collision
-            dx = p.x - self.target["x"]
-            dy = p.y - self.target["y"]
-            if dx * dx + dy * dy <= self.target["r"] ** 2:
+            if in_target(p, self.target):
                 to_remove.append(p)
                 self.spawn_explosion(p.x, p.y, power=1.8, num=120)
                 # small target push (move target a bit)
                 self.target["x"] += random.uniform(-12, 12)
                 self.target["y"] += random.uniform(-8, 8)
                 continue
-            # off-screen
-            if p.x < -200 or p.x > self.WIDTH + 200 or p.y < -500 or p.y > self.HEIGHT + 500:
+            # left the simulated region (not the view: off-view shots keep flying)
+            if outside(p, bounds):
                 to_remove.append(p)
         # remove
         for p in to_remove:
@@ -203,12 +347,33 @@ class Simulator(Projectile):
 
         # particles
         new_particles = []
-        for q in self.particles:
-            q.step(dt)
-            if q.life > 0 and 0 <= q.x <= self.WIDTH * 2 and -500 <= q.y <= self.HEIGHT + 500:
-                new_particles.append(q)
+        collide = self.PARTICLE_GROUND_COLLISION
+        ground_y = self.GROUND_Y
+        x0, y0, x1, y1 = self.particle_bounds()
+        winds = repeat((None, 0.0))
+        if field is not None and self.particles:
+            wu, wv = field.sample([q.x for q in self.particles], [q.y for q in self.particles], self.WIND)
+            winds = zip(wu.tolist(), wv.tolist())
+        for q, (wu, wv) in zip(self.particles, winds):
+            q.step(dt, wu, wv)
+            if q.life > 0 and x0 <= q.x <= x1 and y0 <= q.y <= y1:
+                if collide and q.y >= ground_y and q.ground_contact(
+                    ground_y, self.PARTICLE_RESTITUTION, self.PARTICLE_FRICTION, self.PARTICLE_SLEEP_SPEED
+                ):
+                    self.sleeping.append(q)
+                else:
+                    new_particles.append(q)
         self.particles = new_particles
 
+        # sleeping particles only burn down their life
+        if self.sleeping:
+            still = []
+            for q in self.sleeping:
+                q.life -= dt
+                if q.life > 0:
+                    still.append(q)
+            self.sleeping = still
+
     def gauss_like(self,n=8):
         return sum(random.random() for _ in range(n)) / n
 
@@ -243,30 +408,34 @@ class Simulator(Projectile):
         return pts
 
 
-    def render(self):
-        c = self.canvas
-        c.delete("all")
-        # background
-        c.create_rectangle(0, 0, self.WIDTH, self.HEIGHT, fill="black", outline="")
-
-        # ground
-        c.create_rectangle(0, self.GROUND_Y,self. WIDTH, self.HEIGHT, fill="#1b1b1b", outline="")
+    def render(self, renderer=None):
+        # --> geometry is computed here, the backend (Tk canvas, offscreen raster, recorder) only draws it.
+        # Entities outside the camera view are dropped before any draw call.
+        r = renderer if renderer is not None else self.renderer
+        cam = self.camera
+        z, cx, cy = cam.zoom, cam.x, cam.y
+        vx0, vy0, vx1, vy1 = cam.visible()
+        culled = 0
+        r.begin_frame(self.WIDTH, self.HEIGHT)
+        # background + ground
+        r.draw_background(self.WIDTH, self.HEIGHT, (self.GROUND_Y - cy) * z)
 
         # target
         tx, ty, tr = self.target["x"], self.target["y"], self.target["r"]
-        c.create_oval(
-            tx - tr, ty - tr, tx + tr, ty + tr, fill="#7a0f0f", outline="red", width=2
-        )
-        c.create_text(tx, ty, text="TARGET", fill="#ffd7d7", font=("Helvetica", 10))
+        if vx0 - tr <= tx <= vx1 + tr and vy0 - tr <= ty <= vy1 + tr:
+            r.draw_target((tx - cx) * z, (ty - cy) * z, tr * z)
 
         # draw particles (back to front)
-        for q in self.particles:
+        items = []
+        for q in self.sleeping + self.particles:
+            s = q.size
+            if not (vx0 - s <= q.x <= vx1 + s and vy0 - s <= q.y <= vy1 + s):
+                culled += 1
+                continue
             alpha = self.clamp(q.life / q.max_life, 0.0, 1.0)
-            size = q.size * (0.5 + 0.5 * alpha)
-            # fade color by mixing with black
-            c.create_oval(
-                q.x - size, q.y - size, q.x + size, q.y + size, fill=q.col, outline=""
-            )
+            size = s * (0.5 + 0.5 * alpha)
+            items.append(((q.x - cx) * z, (q.y - cy) * z, size * z, q.col))
+        r.draw_particles(items)
 
         # draw projectiles and flames
         for p in self.projectiles:
@@ -274,6 +443,11 @@ class Simulator(Projectile):
             speed = math.hypot(p.vx, p.vy)
             # flame length scales with speed (clamped)
             flame_len = self.clamp(10 + speed * 0.03, 12, 120)
+            # nothing of it can be on screen: flame length plus its widest wiggle
+            reach = flame_len + 80
+            if not (vx0 - reach <= p.x <= vx1 + reach and vy0 - reach <= p.y <= vy1 + reach):
+                culled += 1
+                continue
             # flame std depends on speed (faster -> more turbulent)
             flame_std = self.clamp(6 + speed * 0.03, 6, 48)
 
@@ -296,59 +470,86 @@ class Simulator(Projectile):
                 if len(pts) >= 2:
                     flat = []
                     for xx, yy in pts:
-                        flat.extend((xx, yy))
-                    c.create_line(*flat, fill=col, width=w, smooth=True, splinesteps=6)
+                        flat.extend(((xx - cx) * z, (yy - cy) * z))
+                    r.draw_flame(flat, col, w)
 
             # projectile core
-            c.create_oval(p.x - 4, p.y - 4, p.x + 4, p.y + 4, fill="white", outline="")
-            c.create_oval(
-                p.x - 8, p.y - 8, p.x + 8, p.y + 8, outline="", fill="#FF6F3C"
-            )
+            r.draw_projectile((p.x - cx) * z, (p.y - cy) * z)
+        self.culled = culled
 
         # draw origin / cannon
         ox, oy = self.origin
-        # barrel end
-        angle = self.aim_angle
-        bx = ox + math.cos(angle) * 60
-        by = oy + math.sin(angle) * 60
-        c.create_line(ox, oy, bx, by, fill="#666666", width=10, capstyle="round")
-        c.create_oval(ox - 10, oy - 10, ox + 10, oy + 10, fill="#444444", outline="")
-
-        # wind arrow
-        wind_label = f"WIND: {self.WIND:.1f} px/s"
-        c.create_text(12, self.HEIGHT - 24, anchor="w", fill="white", text=wind_label)
+        if vx0 - 70 <= ox <= vx1 + 70 and vy0 - 70 <= oy <= vy1 + 70:
+            # barrel end
+            angle = self.aim_angle
+            bx = ox + math.cos(angle) * 60
+            by = oy + math.sin(angle) * 60
+            r.draw_cannon((ox - cx) * z, (oy - cy) * z, (bx - cx) * z, (by - cy) * z)
+
+        # wind field arrows (debug), one arrow per 80 screen pixels whatever the zoom
+        if self.show_debug and self.wind_field is not None and self.WIND_FIELD:
+            segments = self.wind_field.arrows((vx0, vy0, vx1, vy1), spacing=80.0 / z, base=self.WIND)
+            r.draw_wind_arrows(
+                [((x0 - cx) * z, (y0 - cy) * z, (x1 - cx) * z, (y1 - cy) * z) for x0, y0, x1, y1 in segments]
+            )
 
-        # hint text
-        c.create_text(
-            12,
-            12,
-            anchor="nw",
-            fill="white",
-            text=self.hint_string(),
-            font=("Helvetica", 11),
-        )
+        # aim-assist: where the current aim first touches the ground
+        preview = self.impact_preview() if self.show_debug else None
+        if preview is not None:
+            r.draw_impact_marker((preview[0] - cx) * z, (self.GROUND_Y - cy) * z)
 
-        # debug overlay (optional)
+        # wind label, hint text and debug overlay (optional)
+        wind_label = f"WIND: {self.WIND:.1f} px/s"
+        debug_text = None
         if self.show_debug:
-            fps_text = "PROJECTILES: %d    PARTICLES: %d" % (
-                len(self.projectiles),
-                len(self.particles),
+            fs = self.fire_scheduler
+            pb = self.particle_budget
+            fp = self.frame_pacer
+            debug_text = (
+                "PROJECTILES: %d    PARTICLES: %d (ACTIVE %d  SLEEPING %d)    FIRE RATE: %.0f/%.0f per s\n"
+                "EVICTED: %d    MERGED: %d    REJECTED: %d\n"
+                "CAMERA: %.0f, %.0f  x%.2f %s    CULLED: %d\n"
+                "FPS: %.1f/%s    LATE: %d    SKIPPED RENDERS: %d    JITTER: %.2f ms"
+                "%s"
+                % (
+                    len(self.projectiles),
+                    len(self.particles) + len(self.sleeping),
+                    len(self.particles),
+                    len(self.sleeping),
+                    fs.achieved_rate,
+                    self.AUTO_FIRE_RATE,
+                    pb.evicted,
+                    pb.merged,
+                    pb.rejected,
+                    cam.x,
+                    cam.y,
+                    z,
+                    cam.mode.upper(),
+                    culled,
+                    fp.fps,
+                    "MAX" if self.MAX_THROUGHPUT else "%d" % self.TARGET_FPS,
+                    fp.late,
+                    fp.skipped,
+                    fp.jitter * 1000.0,
+                    "" if preview is None else "\nIMPACT: x=%.0f  t=%.2fs" % preview,
+                )
             )
-            c.create_text(self.WIDTH - 12, 12, anchor="ne", fill="lightgreen", text=fps_text)
+        r.draw_hud(self.WIDTH, self.HEIGHT, wind_label, self.hint_string(), debug_text)
+        return r.end_frame()
 
     def loop(self):
-        now = time.time()
-        dt = now - self.last_time
+        pacer = self.frame_pacer
+        dt, draw = pacer.start_frame(self.TARGET_FPS, self.MAX_THROUGHPUT)
         # clamp dt to avoid big jumps if OS paused
         dt = self.clamp(dt, 0.0, 1.0 / 15.0)
-        self.last_time = now
 
         # simulation step
         self.step_sim(dt)
+        self.update_camera(dt)
 
-        # render
-        self.render()
+        # render, unless this frame is behind schedule and has to catch up
+        if draw:
+            self.render()
 
-        # schedule next frame
-        delay = int(1000.0 / self.TARGET_FPS)
-        self.root.after(delay, self.loop)
\ No newline at end of file
+        # schedule next frame on its deadline, less the time this one took
+        self.root.after(pacer.next_delay(self.MAX_THROUGHPUT), self.loop)
@@ -0,0 +1,113 @@
+import re
+
+
+_SPECIAL = re.compile(r'[\s"\\{}\[\]$;]')
+
+# Tcl side helper: many ovals from one flat list, in order, without a Python round trip each
+_PROCS = """
+namespace eval ::simbatch {}
+proc ::simbatch::ovals {w data} {
+    foreach {x0 y0 x1 y1 fill} $data {
+        $w create oval $x0 $y0 $x1 $y1 -fill $fill -outline {}
+    }
+}
+"""
+
+
+def tcl_quote(s):
+    """Quote a string as one Tcl word (backslash-escaping anything special)."""
+    s = str(s)
+    if s == "":
+        return "{}"
+    if not _SPECIAL.search(s):
+        return s
+    return _SPECIAL.sub(lambda m: "\\n" if m.group() == "\n" else "\\" + m.group(), s)
+
+
+def tcl_word(v):
+    if isinstance(v, bool):
+        return "1" if v else "0"
+    if isinstance(v, float):
+        return "%.1f" % v
+    if isinstance(v, (tuple, list)):
+        return tcl_quote(" ".join(tcl_word(x) for x in v))
+    return tcl_quote(v)
+
+
+class CanvasBatch:
+    """
+    Collects the canvas commands of one frame as Tcl script text and submits
+    them with a single tk.eval in flush(), instead of one Python -> Tcl round
+    trip through _tkinter per create_* call.
+    """
+
+    def __init__(self, tkapp, path):
+        self.tk = tkapp
+        self.w = path  # widget path of the canvas, e.g. ".!canvas"
+        self.parts = []
+        self.items = 0
+        self._styles = {}
+        if not int(self.tk.eval("llength [info procs ::simbatch::ovals]")):
+            self.tk.eval(_PROCS)
+
+    @classmethod
+    def for_canvas(cls, canvas):
+        return cls(canvas.tk, str(canvas))
+
+    def _options(self, options):
+        # "-fill red -width 2", cached: a frame reuses a handful of styles thousands of times.
+        # -text is left out of the key, the HUD counters make it different every frame.
+        text = options.pop("text", None)
+        key = tuple(options.items())
+        style = self._styles.get(key)
+        if style is None:
+            style = self._styles[key] = " ".join("-%s %s" % (k, tcl_word(v)) for k, v in key)
+        if text is None:
+            return style
+        return "%s -text %s" % (style, tcl_word(text))
+
+    def command(self, *words, **options):
+        # options follow tkinter's spelling: fill="red" -> -fill red
+        self.parts.append("%s %s %s" % (self.w, " ".join(tcl_word(v) for v in words), self._options(options)))
+        self.items += 1
+
+    def delete_all(self):
+        self.parts.append(self.w + " delete all")
+
+    def rectangle(self, x0, y0, x1, y1, **options):
+        self.parts.append("%s create rectangle %.1f %.1f %.1f %.1f %s" % (self.w, x0, y0, x1, y1, self._options(options)))
+        self.items += 1
+
+    def oval(self, x0, y0, x1, y1, **options):
+        self.parts.append("%s create oval %.1f %.1f %.1f %.1f %s" % (self.w, x0, y0, x1, y1, self._options(options)))
+        self.items += 1
+
+    def line(self, flat, **options):
+        self.parts.append("%s create line %s%s" % (self.w, "%.1f " * len(flat) % tuple(flat), self._options(options)))
+        self.items += 1
+
+    def text(self, x, y, **options):
+        self.parts.append("%s create text %.1f %.1f %s" % (self.w, x, y, self._options(options)))
+        self.items += 1
+
+    def ovals(self, items):
+        # items: (x, y, radius, fill), drawn in order by ::simbatch::ovals
+        if not items:
+            return
+        data = " ".join(
+            ["%.1f %.1f %.1f %.1f %s" % (x - r, y - r, x + r, y + r, tcl_quote(col)) for x, y, r, col in items]
+        )
+        self.parts.append("::simbatch::ovals %s {%s}" % (self.w, data))
+        self.items += len(items)
+
+    def flush(self):
+        """Run everything collected so far as one Tcl script; returns how many items it drew."""
+        n = self.items
+        try:
+            if self.parts:
+                self.tk.eval("\n".join(self.parts))
+        finally:
+            # a script that failed is dropped, not re-run with the next frame appended
+            self.parts = []
+            self.items = 0
+        return n
@@ -0,0 +1,221 @@
+"""
+Many independent copies of the cannon scene stepped together, for tuning aim
+heuristics and driving automated agents without a window.
+
+Every piece of state is an array with the environment on the leading axis
+(and a projectile slot on the second one), so one step() is a fixed number of
+numpy operations whatever the batch size. Each environment has its own target,
+wind and cannon angle. Projectiles use the Projectile.step update and the
+ground/target/out-of-world rules from Ballistics, without particles.
+
+An episode ends when the target is hit or after max_steps; that environment
+is reset on the spot, so the batch never has to wait for its slowest member.
+"""
+
+import math
+
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except Exception:
+    HAS_NUMPY = False
+
+from .Ballistics import BOUNCE_SPEED, BOUNCE_KEEP_VX, BOUNCE_KEEP_VY, lifetime_bounds
+
+
+AIM = 0  # action columns: aim change in radians (clipped to max_turn per step)
+FIRE = 1  # > 0.5 fires when the cannon has reloaded and a projectile slot is free
+
+_M1 = 0x9E3779B97F4A7C15
+_M2 = 0xBF58476D1CE4E5B9
+_M3 = 0x94D049BB133111EB
+
+
+def _uniform(seeds, episodes, k):
+    """
+    Uniform [0, 1) draw number k of every (seed, episode), splitmix64 style.
+    Counter based: an environment gets the same scene for the same seed and
+    episode whatever else is in the batch, and no generator is kept per env.
+    """
+    z = seeds * np.uint64(_M1) + episodes * np.uint64(_M2) + np.uint64((k + 1) * _M3 % 2**64)
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(_M2)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(_M3)
+    z ^= z >> np.uint64(31)
+    return (z >> np.uint64(11)).astype(np.float64) * (1.0 / 2**53)
+
+
+class VectorEnv:
+    def __init__(
+        self,
+        num_envs,
+        max_projectiles=8,
+        gravity=700.0,
+        drag=0.995,
+        speed=1200.0,
+        fire_rate=10.0,
+        wind_range=(-200.0, 200.0),
+        target_x=(400.0, 900.0),
+        target_y=(360.0, 620.0),
+        target_r=36.0,
+        origin=(80.0, 660.0),
+        ground_y=660.0,
+        width=1000.0,
+        height=700.0,
+        dt=1.0 / 60.0,
+        max_steps=600,
+        max_turn=0.1,
+    ):
+        if not HAS_NUMPY:
+            raise RuntimeError("VectorEnv needs numpy (python -m pip install numpy)")
+        self.num_envs = n = int(num_envs)
+        self.max_projectiles = k = int(max_projectiles)
+        self.gravity = gravity
+        self.drag_factor = 1.0 - (1.0 - drag) * dt * 60.0  # same per-step drag as Projectile.step
+        self.speed = speed
+        self.reload = 1.0 / fire_rate if fire_rate > 0 else math.inf
+        self.wind_range = wind_range
+        self.target_x = target_x
+        self.target_y = target_y
+        self.target_r = target_r
+        self.origin = origin
+        self.ground_y = ground_y
+        self.bounds = lifetime_bounds(width, height)
+        self.dt = dt
+        self.max_steps = max_steps
+        self.max_turn = max_turn
+
+        # per environment
+        self.seeds = np.arange(n, dtype=np.uint64)
+        self.episodes = np.zeros(n, dtype=np.uint64)
+        self.angle = np.full(n, -math.pi / 4)
+        self.wind = np.zeros(n)
+        self.target = np.zeros((n, 3))  # x, y, r
+        self.cooldown = np.zeros(n)
+        self.steps = np.zeros(n, dtype=np.int64)
+        self.shots = np.zeros(n, dtype=np.int64)
+        # per projectile slot
+        self.x = np.zeros((n, k))
+        self.y = np.zeros((n, k))
+        self.vx = np.zeros((n, k))
+        self.vy = np.zeros((n, k))
+        self.alive = np.zeros((n, k), dtype=bool)
+        self._rows = np.arange(n)
+
+    def reset(self, seeds=None):
+        """Start a new episode in every environment; seeds is one int per env (default 0..n-1)."""
+        if seeds is not None:
+            seeds = np.asarray(seeds, dtype=np.uint64)
+            if seeds.shape != (self.num_envs,):
+                raise ValueError("need one seed per environment, got shape %s" % (seeds.shape,))
+            self.seeds = seeds.copy()
+        self.episodes[:] = 0
+        self._reset_envs(np.ones(self.num_envs, dtype=bool))
+        return self.observe()
+
+    def _reset_envs(self, mask):
+        # new scene for the environments in mask, drawn from (seed, episode)
+        s = self.seeds[mask]
+        e = self.episodes[mask]
+        lo, hi = self.wind_range
+        self.wind[mask] = lo + (hi - lo) * _uniform(s, e, 0)
+        lo, hi = self.target_x
+        self.target[mask, 0] = lo + (hi - lo) * _uniform(s, e, 1)
+        lo, hi = self.target_y
+        self.target[mask, 1] = lo + (hi - lo) * _uniform(s, e, 2)
+        self.target[mask, 2] = self.target_r
+        self.angle[mask] = -math.pi / 4
+        self.cooldown[mask] = 0.0
+        self.steps[mask] = 0
+        self.shots[mask] = 0
+        self.alive[mask] = False
+
+    def observe(self):
+        """Observation arrays, environment on the leading axis."""
+        return {
+            "angle": self.angle.copy(),
+            "wind": self.wind.copy(),
+            "target": self.target.copy(),
+            "cooldown": self.cooldown.copy(),
+            "projectiles": np.stack((self.x, self.y, self.vx, self.vy), axis=-1),  # (n, k, 4)
+            "alive": self.alive.copy(),
+        }
+
+    def step(self, actions):
+        """
+        actions: (n, 2) array of [aim change, fire] per environment (see AIM / FIRE).
+        Returns (observation, reward, done, info). reward is 1 for a target hit;
+        done environments are already reset, so observation starts their next episode.
+        """
+        actions = np.asarray(actions, dtype=np.float64)
+        if actions.shape != (self.num_envs, 2):
+            raise ValueError("actions must have shape (%d, 2), got %s" % (self.num_envs, actions.shape))
+        dt = self.dt
+
+        # aim, kept in the upper half plane like the mouse aim
+        turn = np.clip(actions[:, AIM], -self.max_turn, self.max_turn)
+        np.clip(self.angle + turn, -math.pi, 0.0, out=self.angle)
+
+        # fire into the first free slot of every env that wants to, has reloaded and has room
+        self.cooldown -= dt
+        free = ~self.alive
+        fire = (actions[:, FIRE] > 0.5) & (self.cooldown <= 0.0) & free.any(axis=1)
+        rows = self._rows[fire]
+        if rows.size:
+            slots = free[rows].argmax(axis=1)
+            a = self.angle[rows]
+            self.x[rows, slots] = self.origin[0]
+            self.y[rows, slots] = self.origin[1]
+            self.vx[rows, slots] = np.cos(a) * self.speed
+            self.vy[rows, slots] = np.sin(a) * self.speed
+            self.alive[rows, slots] = True
+            self.cooldown[rows] = self.reload
+            self.shots[rows] += 1
+
+        # integrate every slot (dead ones too, it is cheaper than indexing); same order as Projectile.step
+        f = self.drag_factor
+        self.vx += self.wind[:, None] * dt
+        self.vy += self.gravity * dt
+        self.vx *= f
+        self.vy *= f
+        self.x += self.vx * dt
+        self.y += self.vy * dt
+
+        # ground: bounce fast shots, settle slow ones (Ballistics.ground_contact)
+        alive = self.alive
+        ground = alive & (self.y >= self.ground_y)
+        np.minimum(self.y, self.ground_y, out=self.y, where=ground)
+        bounce = ground & (np.abs(self.vy) > BOUNCE_SPEED)
+        self.vy[bounce] *= -BOUNCE_KEEP_VY
+        self.vx[bounce] *= BOUNCE_KEEP_VX
+        # target, only for shots that did not touch the ground this step
+        dx = self.x - self.target[:, 0:1]
+        dy = self.y - self.target[:, 1:2]
+        hit = alive & ~ground & (dx * dx + dy * dy <= self.target[:, 2:3] ** 2)
+        x0, y0, x1, y1 = self.bounds
+        out = alive & ~ground & ~hit & ((self.x < x0) | (self.x > x1) | (self.y < y0) | (self.y > y1))
+        alive &= ~((ground & ~bounce) | hit | out)
+
+        self.steps += 1
+        reward = hit.sum(axis=1).astype(np.float64)
+        hit_env = reward > 0
+        truncated = ~hit_env & (self.steps >= self.max_steps)
+        done = hit_env | truncated
+        info = {"hit": hit_env, "truncated": truncated, "length": self.steps.copy(), "shots": self.shots.copy()}
+        if done.any():
+            self.episodes[done] += np.uint64(1)
+            self._reset_envs(done)
+        return self.observe(), reward, done, info
+
+    def aim_at_target(self):
+        """
+        Baseline policy: the angle that would hit each target in still air with
+        no drag (the lower of the two arcs), NaN when the target is out of range.
+        """
+        dx = self.target[:, 0] - self.origin[0]
+        dy = self.origin[1] - self.target[:, 1]  # height above the cannon
+        v2 = self.speed * self.speed
+        g = self.gravity
+        disc = v2 * v2 - g * (g * dx * dx + 2.0 * dy * v2)
+        with np.errstate(invalid="ignore"):
+            return -np.arctan2(v2 - np.sqrt(disc), g * dx)
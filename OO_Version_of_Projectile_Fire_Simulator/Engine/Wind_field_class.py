@@ -0,0 +1,137 @@
+import math
+import random
+
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except Exception:
+    HAS_NUMPY = False
+
+
+class Gust:
+    __slots__ = ("x", "y", "vx", "vy", "u", "v", "sigma", "life", "stamp")
+
+    def __init__(self, x, y, vx, vy, u, v, sigma, life):
+        self.x = x
+        self.y = y
+        self.vx = vx
+        self.vy = vy
+        self.u = u  # peak wind at the centre (px/s^2, same unit as WIND)
+        self.v = v
+        self.sigma = sigma
+        self.life = life
+        self.stamp = None  # (row slice, col slice, weights) currently added to the grid
+
+
+class WindField:
+    """
+    2D wind over the world: a grid of (u, v) vectors plus the uniform WIND.
+
+    Gusts are gaussian blobs drifting across the grid. Each frame a gust takes
+    its old contribution off the cells under it and adds the new one, so only
+    those cells change; the grid is never rebuilt. Entities sample it in one
+    vectorised bilinear interpolation over all their positions.
+    """
+
+    def __init__(self, x0, y0, x1, y1, cell=40.0, gusts=4, strength=150.0, radius=140.0, seed=None):
+        if not HAS_NUMPY:
+            raise RuntimeError("WindField needs numpy (python -m pip install numpy)")
+        self.x0 = float(x0)
+        self.y0 = float(y0)
+        self.cell = float(cell)
+        self.nx = int(math.ceil((x1 - x0) / cell)) + 1
+        self.ny = int(math.ceil((y1 - y0) / cell)) + 1
+        self.u = np.zeros((self.ny, self.nx))
+        self.v = np.zeros((self.ny, self.nx))
+        self.bounds = (x0, y0, x1, y1)
+        self.strength = strength
+        self.radius = radius
+        self.rng = random.Random(seed)  # own generator, the simulation's random stream stays untouched
+        self.gusts = []
+        for _ in range(gusts):
+            g = self._new_gust()
+            self._apply(g, 1.0)
+            self.gusts.append(g)
+
+    def _new_gust(self):
+        x0, y0, x1, y1 = self.bounds
+        rng = self.rng
+        ang = rng.uniform(-math.pi, math.pi)
+        mag = self.strength * rng.uniform(0.4, 1.0)
+        drift = rng.uniform(30, 120)
+        dang = ang + rng.uniform(-0.5, 0.5)
+        return Gust(
+            rng.uniform(x0, x1),
+            rng.uniform(y0, y1),
+            math.cos(dang) * drift,
+            math.sin(dang) * drift * 0.3,
+            math.cos(ang) * mag,
+            math.sin(ang) * mag * 0.3,  # mostly horizontal
+            self.radius * rng.uniform(0.6, 1.2),
+            rng.uniform(3.0, 8.0),
+        )
+
+    def _apply(self, g, sign):
+        # add (sign=1) or remove (sign=-1) a gust; removal reuses the exact stamp that was added
+        if sign < 0:
+            if g.stamp is None:
+                return
+            rows, cols, w = g.stamp
+            self.u[rows, cols] -= w * g.u
+            self.v[rows, cols] -= w * g.v
+            g.stamp = None
+            return
+        reach = 3.0 * g.sigma
+        c0 = max(int((g.x - reach - self.x0) // self.cell), 0)
+        c1 = min(int((g.x + reach - self.x0) // self.cell) + 2, self.nx)
+        r0 = max(int((g.y - reach - self.y0) // self.cell), 0)
+        r1 = min(int((g.y + reach - self.y0) // self.cell) + 2, self.ny)
+        if c0 >= c1 or r0 >= r1:
+            return
+        gx = self.x0 + np.arange(c0, c1) * self.cell - g.x
+        gy = self.y0 + np.arange(r0, r1) * self.cell - g.y
+        w = np.exp(-(gy[:, None] ** 2 + gx[None, :] ** 2) / (2.0 * g.sigma * g.sigma))
+        rows, cols = slice(r0, r1), slice(c0, c1)
+        self.u[rows, cols] += w * g.u
+        self.v[rows, cols] += w * g.v
+        g.stamp = (rows, cols, w)
+
+    def update(self, dt):
+        x0, y0, x1, y1 = self.bounds
+        for i, g in enumerate(self.gusts):
+            self._apply(g, -1.0)
+            g.x += g.vx * dt
+            g.y += g.vy * dt
+            g.life -= dt
+            if g.life <= 0 or not (x0 <= g.x <= x1 and y0 <= g.y <= y1):
+                g = self.gusts[i] = self._new_gust()
+            self._apply(g, 1.0)
+
+    def sample(self, xs, ys, base=0.0):
+        """Bilinear (u, v) at every (x, y); positions outside the grid use the nearest edge. base is added to u."""
+        gx = (np.asarray(xs, dtype=np.float64) - self.x0) / self.cell
+        gy = (np.asarray(ys, dtype=np.float64) - self.y0) / self.cell
+        np.clip(gx, 0.0, self.nx - 1.000001, out=gx)
+        np.clip(gy, 0.0, self.ny - 1.000001, out=gy)
+        c = gx.astype(np.int64)
+        r = gy.astype(np.int64)
+        fx = gx - c
+        fy = gy - r
+        w00 = (1 - fx) * (1 - fy)
+        w01 = fx * (1 - fy)
+        w10 = (1 - fx) * fy
+        w11 = fx * fy
+        u, v = self.u, self.v
+        su = u[r, c] * w00 + u[r, c + 1] * w01 + u[r + 1, c] * w10 + u[r + 1, c + 1] * w11
+        sv = v[r, c] * w00 + v[r, c + 1] * w01 + v[r + 1, c] * w10 + v[r + 1, c + 1] * w11
+        return su + base, sv
+
+    def arrows(self, region, spacing=80.0, scale=0.4, base=0.0):
+        """Low-resolution (x0, y0, x1, y1) arrow segments over region (x0, y0, x1, y1) for the debug overlay."""
+        x0, y0, x1, y1 = region
+        xs, ys = np.meshgrid(np.arange(x0 + spacing / 2, x1, spacing), np.arange(y0 + spacing / 2, y1, spacing))
+        u, v = self.sample(xs.ravel(), ys.ravel(), base)
+        px = xs.ravel()
+        py = ys.ravel()
+        return list(zip(px.tolist(), py.tolist(), (px + u * scale).tolist(), (py + v * scale).tolist()))
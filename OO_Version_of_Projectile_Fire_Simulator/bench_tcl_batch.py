@@ -0,0 +1,91 @@
+"""
+Microbenchmark: per-item cost of drawing a frame with one _tkinter call per
+canvas item (TkRenderer) vs one Tcl evaluation per frame (BatchedTkRenderer).
+
+    python bench_tcl_batch.py --particles 1000 8000
+
+Without a display a bare Tcl interpreter is used and the canvas is a no-op Tcl
+proc, which isolates the Python -> Tcl crossing cost that batching removes.
+"""
+
+import argparse
+import random
+import time
+import tkinter as tk
+
+from Engine.Renderer_class import TkRenderer, BatchedTkRenderer
+
+
+def stand_in_canvas(tkapp, path):
+    """
+    A real tkinter.Canvas object bound to a plain Tcl command instead of a widget,
+    so create_* runs tkinter's own argument handling and _tkinter crossing.
+    """
+    canvas = tk.Canvas.__new__(tk.Canvas)
+    canvas.tk = tkapp
+    canvas._w = path
+    canvas._tclCommands = None
+    return canvas
+
+
+def make_canvas():
+    try:
+        root = tk.Tk()
+        root.withdraw()
+        canvas = tk.Canvas(root, width=1000, height=700)
+        canvas.pack()
+        return canvas, "Tk canvas"
+    except tk.TclError:
+        interp = tk.Tcl()
+        interp.eval("proc .c {args} {return 1}")
+        return stand_in_canvas(interp, ".c"), "bare Tcl, no-op canvas command (no display)"
+
+
+def frame(renderer, items, projectiles):
+    renderer.begin_frame(1000, 700)
+    renderer.draw_background(1000, 700, 660)
+    renderer.draw_target(840, 540, 36)
+    renderer.draw_particles(items)
+    for x, y, flat in projectiles:
+        for col, w in (("#FFF8B0", 2.0), ("#FFB347", 3.5), ("#D93F1A", 5.5)):
+            renderer.draw_flame(flat, col, w)
+        renderer.draw_projectile(x, y)
+    renderer.draw_cannon(80, 660, 122, 618)
+    renderer.draw_hud(1000, 700, "WIND: 0.0 px/s", "hint text", "PROJECTILES: 0")
+    renderer.end_frame()
+
+
+def bench(renderer, items, projectiles, repeat):
+    best = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        frame(renderer, items, projectiles)
+        dt = time.perf_counter() - t0
+        best = dt if best is None or dt < best else best
+    return best
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--particles", type=int, nargs="+", default=[100, 1000, 8000])
+    ap.add_argument("--projectiles", type=int, default=40)
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args()
+
+    canvas, mode = make_canvas()
+    rnd = random.Random(0)
+    print("mode: %s" % mode)
+    print("%10s %8s %14s %14s %8s" % ("particles", "items", "direct us/item", "batched us/item", "speedup"))
+    for n in args.particles:
+        items = [(rnd.uniform(0, 1000), rnd.uniform(0, 700), rnd.uniform(1, 6), "#%02x%02x14" % (rnd.randint(200, 255), rnd.randint(50, 180))) for _ in range(n)]
+        projectiles = []
+        for _ in range(args.projectiles):
+            x, y = rnd.uniform(0, 1000), rnd.uniform(0, 600)
+            projectiles.append((x, y, [v for i in range(5) for v in (x - 10 * i, y + rnd.uniform(-5, 5))]))
+        count = n + args.projectiles * 5 + 9  # canvas items in one frame
+        direct = bench(TkRenderer(canvas), items, projectiles, args.repeat)
+        batched = bench(BatchedTkRenderer(canvas), items, projectiles, args.repeat)
+        print(
+            "%10d %8d %14.2f %14.2f %7.1fx"
+            % (n, count, direct / count * 1e6, batched / count * 1e6, direct / batched)
+        )
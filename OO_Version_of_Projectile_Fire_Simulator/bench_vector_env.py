@@ -0,0 +1,55 @@
+"""
+Throughput of the vectorised multi-environment engine against batch size.
+
+    python bench_vector_env.py --batch 1 16 256 4096 --steps 600
+
+Every environment runs the baseline policy (aim at the target in still air,
+plus noise, fire whenever reloaded). Environment-steps per second should grow
+roughly with the batch size until numpy's per-element cost dominates.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from Engine.Vector_env import VectorEnv, AIM, FIRE
+
+
+def run(n, steps, seed):
+    env = VectorEnv(n)
+    env.reset(np.arange(n) + seed * n)
+    rng = np.random.default_rng(seed)
+    actions = np.zeros((n, 2))
+    actions[:, FIRE] = 1.0
+    hits = episodes = 0
+    t0 = time.perf_counter()
+    for _ in range(steps):
+        want = np.nan_to_num(env.aim_at_target(), nan=-0.8) + rng.normal(0.0, 0.05, n)
+        actions[:, AIM] = want - env.angle
+        _, reward, done, info = env.step(actions)
+        hits += int(info["hit"].sum())
+        episodes += int(done.sum())
+    return time.perf_counter() - t0, hits, episodes
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--batch", type=int, nargs="+", default=[1, 16, 256, 4096])
+    ap.add_argument("--steps", type=int, default=600)
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args()
+
+    print("%8s %12s %16s %12s %10s" % ("envs", "steps/s", "env-steps/s", "us/env-step", "hit rate"))
+    for n in args.batch:
+        elapsed, hits, episodes = run(n, args.steps, args.seed)
+        print(
+            "%8d %12.0f %16.0f %12.2f %9.0f%%"
+            % (
+                n,
+                args.steps / elapsed,
+                n * args.steps / elapsed,
+                elapsed / (n * args.steps) * 1e6,
+                100.0 * hits / max(episodes, 1),
+            )
+        )
@@ -0,0 +1,56 @@
+import argparse
+import math
+
+from Engine.Offline_render import render_session, FORMATS
+
+
+def demo_script(sim, i):
+    # sweep the barrel up and down and fire a shot every 6 frames
+    sim.aim_angle = -math.pi / 4 + 0.35 * math.sin(i / 40.0)
+    if i % 6 == 0:
+        ox, oy = sim.origin
+        sim.fire(ox + math.cos(sim.aim_angle) * 100, oy + math.sin(sim.aim_angle) * 100)
+
+
+def configure(sim):
+    # same values as Application.py
+    sim.AIR_DRAG = 0.995
+    sim.WIND = 0.0
+    sim.GRAVITY = 700.0
+    sim.PROJECTILE_SPEED = 1200.0
+    sim.MAX_PROJECTILES = 1000
+    sim.MAX_PARTICLES = 8000
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="Render the demo session offline to images or raw video.")
+    ap.add_argument("--out", default="render_out", help="output folder (png/ppm) or file (rgb)")
+    ap.add_argument("--frames", type=int, default=300)
+    ap.add_argument("--fps", type=int, default=60)
+    ap.add_argument("--format", choices=FORMATS, default="png")
+    ap.add_argument("--workers", type=int, default=None)
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args()
+
+    stats = render_session(
+        demo_script,
+        args.out,
+        args.frames,
+        fps=args.fps,
+        fmt=args.format,
+        workers=args.workers,
+        seed=args.seed,
+        configure=configure,
+    )
+    print(
+        "%d frames %sx%s -> %s in %.2fs (%.1f fps, %.1fx real time)"
+        % (
+            stats["frames"],
+            stats["size"][0],
+            stats["size"][1],
+            args.out,
+            stats["wall_s"],
+            stats["render_fps"],
+            stats["realtime_x"],
+        )
+    )
@@ -0,0 +1,21 @@
+import argparse
+import asyncio
+
+from Engine.Shot_service import serve
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="Local newline-delimited JSON shot-simulation service.")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8765)
+    ap.add_argument("--unix", default=None, help="listen on this Unix socket path instead of TCP")
+    ap.add_argument("--workers", type=int, default=None)
+    ap.add_argument("--cache-size", type=int, default=4096)
+    args = ap.parse_args()
+
+    where = args.unix or "%s:%d" % (args.host, args.port)
+    print("shot service listening on %s" % where)
+    try:
+        asyncio.run(serve(args.host, args.port, args.unix, args.workers, args.cache_size))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,92 @@
+"""
+check_particle_budget.py
+
+Regression checks for the OO engine's ParticleBudget under full-list pressure:
+
+  * a burst into a list full of protected (fresh) particles makes at most one
+    make_room pass and rejects the rest of the burst without further passes;
+  * merging a cell-dense list frees only what was needed and keeps the total
+    particle area, never squeezing a group past max_size.
+
+Run:
+    python check_particle_budget.py
+Exit code is 1 when a check fails.
+"""
+
+import os
+import random
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, "OO_Version_of_Projectile_Fire_Simulator"))
+
+from Engine.Simulator_class import Simulator  # noqa: E402
+from Engine.Particle_class import Particle  # noqa: E402
+from Engine.Particle_budget_class import ParticleBudget  # noqa: E402
+
+
+def fill(n, life_left, spread, rnd):
+    # n particles around (500, 300) within `spread` px, with life_left of their life remaining
+    out = []
+    for _ in range(n):
+        q = Particle(500 + rnd.uniform(0, spread), 300 + rnd.uniform(0, spread), 0.0, 0.0, 1.0, rnd.uniform(2, 6), "#ff8014")
+        q.life = q.max_life * life_left
+        out.append(q)
+    return out
+
+
+def check_blocked_burst(rnd):
+    sim = Simulator(None)
+    sim.MAX_PARTICLES = 8000
+    sim.particles = fill(8000, 1.0, 300, rnd)  # all fresh and on screen: nothing may be merged or evicted
+    passes = [0]
+    make_room = sim.particle_budget.make_room
+
+    def counted(*args):
+        passes[0] += 1
+        return make_room(*args)
+
+    sim.particle_budget.make_room = counted
+    t0 = time.perf_counter()
+    sim.spawn_explosion(500, 300, power=1.8, num=120)
+    took = time.perf_counter() - t0
+    burst = int(120 * 1.8)
+    ok = passes[0] <= 1 and sim.particle_budget.rejected == burst and len(sim.particles) == 8000
+    print(
+        "%s: blocked burst of %d into 8000 fresh particles: %d make_room pass(es), %d rejected, %.1f ms"
+        % ("PASS" if ok else "FAIL", burst, passes[0], sim.particle_budget.rejected, took * 1000)
+    )
+    return ok
+
+
+def check_dense_merge(rnd):
+    budget = ParticleBudget()
+    particles = fill(8000, 0.5, 5, rnd)  # old enough to merge, all in one 10 px cell
+    area = sum(q.size * q.size for q in particles)
+    budget.make_room(particles, 8000, (0, 0, 1000, 700))
+    need = 8000 - (8000 - int(8000 * budget.evict_fraction))
+    after = sum(q.size * q.size for q in particles)
+    biggest = max(q.size for q in particles)
+    ok = (
+        budget.merged == need
+        and budget.evicted == 0
+        and abs(after - area) <= 1e-6 * area
+        and biggest <= budget.max_size + 1e-9
+    )
+    print(
+        "%s: cell-dense merge needing %d: merged %d, evicted %d, area %.1f -> %.1f, largest %.2f px"
+        % ("PASS" if ok else "FAIL", need, budget.merged, budget.evicted, area, after, biggest)
+    )
+    return ok
+
+
+def main():
+    random.seed(0)
+    rnd = random.Random(0)
+    results = [check_blocked_burst(rnd), check_dense_merge(rnd)]
+    return 0 if all(results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,163 @@
+"""
+compare_engines.py
+
+Golden-trajectory differential test + throughput comparison between the
+non-OO engine (Non_OO_version_of_Simulator/aim_nd_fire_cpu.py, the golden
+reference) and the OO engine (OO_Version_of_Projectile_Fire_Simulator/Engine).
+
+Both engines are driven headlessly with the same seed, the same fixed dt and
+the same scripted shots. Per-frame state (projectiles, particles, target) is
+compared within a tolerance and the step_sim throughput is reported side by side.
+
+Run:
+    python compare_engines.py --frames 600
+Exit code is 1 when the engines diverge, so it can gate an optimisation.
+"""
+
+import argparse
+import importlib.util
+import math
+import os
+import random
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, "OO_Version_of_Projectile_Fire_Simulator"))
+
+from Engine.Simulator_class import Simulator  # noqa: E402
+
+
+def load_non_oo():
+    path = os.path.join(HERE, "Non_OO_version_of_Simulator", "aim_nd_fire_cpu.py")
+    spec = importlib.util.spec_from_file_location("aim_nd_fire_cpu", path)
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+# defaults of the non-OO script; geometry is left alone so both targets start in the same place
+CONFIG = {
+    "GRAVITY": 700.0,
+    "AIR_DRAG": 0.995,
+    "WIND": 0.0,
+    "PROJECTILE_SPEED": 1200.0,
+    "MAX_PROJECTILES": 40,
+    "MAX_PARTICLES": 800,
+}
+
+
+def baseline(sim):
+    """Switch off OO-only behaviour that the non-OO engine does not have."""
+    sim.PARTICLE_EVICTION = False  # non-OO just stops adding particles at MAX_PARTICLES
+    sim.PARTICLE_GROUND_COLLISION = False  # non-OO particles fall through the ground
+    sim.WIND_FIELD = False  # non-OO wind is one uniform WIND
+
+
+def script(sim, i, fire_every):
+    # sweep the aim over the target and the ground in front of it, fire every `fire_every` frames
+    sim.aim_angle = -0.35 + 0.35 * math.sin(i / 50.0)
+    if i % fire_every == 0:
+        ox, oy = sim.origin
+        sim.fire(ox + math.cos(sim.aim_angle) * 100, oy + math.sin(sim.aim_angle) * 100)
+
+
+def snapshot(sim):
+    return (
+        [(p.x, p.y, p.vx, p.vy) for p in sim.projectiles],
+        [(q.x, q.y, q.vx, q.vy, q.life) for q in sim.particles],
+        (sim.target["x"], sim.target["y"]),
+    )
+
+
+def run(sim, frames, dt, fire_every, seed, trace=True):
+    """Drive one engine; returns (per-frame snapshots, seconds spent in step_sim, entity steps)."""
+    random.seed(seed)
+    states = []
+    busy = 0.0
+    entity_steps = 0
+    for i in range(frames):
+        script(sim, i, fire_every)
+        entity_steps += len(sim.projectiles) + len(sim.particles)
+        t0 = time.perf_counter()
+        sim.step_sim(dt)
+        busy += time.perf_counter() - t0
+        if trace:
+            states.append(snapshot(sim))
+    return states, busy, entity_steps
+
+
+def make_non_oo(mod, config):
+    for k, v in config.items():
+        setattr(mod, k, v)
+    return mod.Simulator(None)
+
+
+def make_oo(config):
+    sim = Simulator(None)
+    for k, v in config.items():
+        setattr(sim, k, v)
+    baseline(sim)
+    return sim
+
+
+def diff(golden, other, tol):
+    """First mismatching frame as (frame, what, detail), or None when every frame agrees."""
+    names = ("projectiles", "particles")
+    for f, (a, b) in enumerate(zip(golden, other)):
+        for n in range(2):
+            if len(a[n]) != len(b[n]):
+                return f, names[n], "count %d != %d" % (len(a[n]), len(b[n]))
+            for j, (ea, eb) in enumerate(zip(a[n], b[n])):
+                err = max(abs(u - v) for u, v in zip(ea, eb))
+                if err > tol:
+                    return f, names[n], "#%d off by %.3g: %r vs %r" % (j, err, ea, eb)
+        err = max(abs(u - v) for u, v in zip(a[2], b[2]))
+        if err > tol:
+            return f, "target", "off by %.3g" % err
+    return None
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Differential test + throughput of the OO and non-OO engines.")
+    ap.add_argument("--frames", type=int, default=600)
+    ap.add_argument("--fps", type=int, default=60)
+    ap.add_argument("--fire-every", type=int, default=4)
+    ap.add_argument("--seed", type=int, default=1234)
+    ap.add_argument("--tol", type=float, default=1e-6)
+    ap.add_argument("--repeat", type=int, default=3, help="timed runs per engine, best one is reported")
+    for k, v in CONFIG.items():
+        ap.add_argument("--" + k.lower().replace("_", "-"), type=type(v), default=v)
+    args = ap.parse_args(argv)
+
+    config = {k: getattr(args, k.lower()) for k in CONFIG}
+    dt = 1.0 / args.fps
+    mod = load_non_oo()
+
+    golden, _, _ = run(make_non_oo(mod, config), args.frames, dt, args.fire_every, args.seed)
+    other, _, _ = run(make_oo(config), args.frames, dt, args.fire_every, args.seed)
+    mismatch = diff(golden, other, args.tol)
+
+    print("frames=%d dt=%.5f seed=%d tol=%g  %s" % (args.frames, dt, args.seed, args.tol, config))
+    print("%-8s %12s %12s %16s" % ("engine", "step ms", "frames/s", "entity steps/s"))
+    results = {}
+    for name, make in (("non-OO", lambda: make_non_oo(mod, config)), ("OO", lambda: make_oo(config))):
+        best = None
+        for _ in range(args.repeat):
+            _, busy, steps = run(make(), args.frames, dt, args.fire_every, args.seed, trace=False)
+            if best is None or busy < best[0]:
+                best = (busy, steps)
+        busy, steps = best
+        results[name] = busy
+        print("%-8s %12.3f %12.0f %16.0f" % (name, busy / args.frames * 1000, args.frames / busy, steps / busy))
+    print("OO / non-OO step time: %.2fx" % (results["OO"] / results["non-OO"]))
+
+    if mismatch is None:
+        print("PASS: per-frame state matches within %g" % args.tol)
+        return 0
+    print("FAIL: frame %d, %s: %s" % mismatch)
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())